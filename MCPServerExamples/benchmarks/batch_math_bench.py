@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Batch math tools vs. looping over the scalar tools.
+
+For each batch size, times computing N square roots, sums and temperature
+conversions two ways: one scalar tool call per value, and a single call to the
+matching ``*_batch`` tool. Both are measured through a real MCP session with
+the learning server spawned over stdio, since per-call round trips are what the
+batch tools save. ``--direct`` calls the tool functions in-process instead,
+which isolates compute cost from protocol overhead.
+
+Usage:
+    python benchmarks/batch_math_bench.py
+    python benchmarks/batch_math_bench.py --sizes 100 1000 10000 --direct
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from mcp import ClientSession
+from mcp.client.stdio import stdio_client
+
+from servers import SERVERS
+
+CallTool = Callable[[str, Dict[str, Any]], Awaitable[Any]]
+
+# (scalar tool, scalar args for value x, batch tool, batch args for values xs)
+CASES: List[Tuple[str, Callable, str, Callable]] = [
+    ("calculate_square_root", lambda x: {"number": x},
+     "calculate_square_root_batch", lambda xs: {"numbers": xs}),
+    ("add_numbers", lambda x: {"a": x, "b": 1.5},
+     "add_numbers_batch", lambda xs: {"a": xs, "b": [1.5]}),
+    ("convert_temperature", lambda x: {"temperature": x, "from_unit": "C", "to_unit": "F"},
+     "convert_temperature_batch", lambda xs: {"temperatures": xs, "from_unit": "C", "to_unit": "F"}),
+]
+
+
+async def run_cases(call_tool: CallTool, sizes: List[int], scalar_limit: int) -> None:
+    rng = random.Random(0)
+    # Warm up so the one-off NumPy import isn't charged to the first batch
+    for _, _, batch_tool, batch_args in CASES:
+        await call_tool(batch_tool, batch_args([1.0]))
+    print(f"{'tool':<24} {'n':>7} {'scalar loop':>12} {'batch':>10} {'speedup':>8}")
+    for scalar_tool, scalar_args, batch_tool, batch_args in CASES:
+        for n in sizes:
+            values = [rng.uniform(0, 1000) for _ in range(n)]
+
+            start = time.perf_counter()
+            await call_tool(batch_tool, batch_args(values))
+            batch = time.perf_counter() - start
+
+            # Looping is linear in n, so time a prefix and extrapolate for big batches
+            looped = min(n, scalar_limit)
+            start = time.perf_counter()
+            for x in values[:looped]:
+                await call_tool(scalar_tool, scalar_args(x))
+            scalar = (time.perf_counter() - start) * n / looped
+
+            note = "" if looped == n else f"  (scalar extrapolated from {looped})"
+            print(f"{scalar_tool:<24} {n:>7} {scalar * 1000:>10.1f}ms {batch * 1000:>8.1f}ms "
+                  f"{scalar / batch:>7.1f}x{note}")
+
+
+async def run_stdio(sizes: List[int], scalar_limit: int) -> None:
+    spec = SERVERS["learning_mcp"]
+    with open(os.devnull, "w") as devnull:
+        async with stdio_client(spec.stdio_params(), errlog=devnull) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                await run_cases(session.call_tool, sizes, scalar_limit)
+
+
+async def run_direct(sizes: List[int], scalar_limit: int) -> None:
+    sys.path.insert(0, str(SERVERS["learning_mcp"].path))
+    import learning_mcp
+
+    async def call_tool(name: str, arguments: Dict[str, Any]) -> Any:
+        return await getattr(learning_mcp, name)(**arguments)
+
+    await run_cases(call_tool, sizes, scalar_limit)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000],
+                        help="batch sizes (default: 100 1000 10000)")
+    parser.add_argument("--scalar-limit", type=int, default=2_000,
+                        help="max scalar calls per measurement before extrapolating (default: 2000)")
+    parser.add_argument("--direct", action="store_true",
+                        help="call the tool functions in-process instead of over stdio")
+    args = parser.parse_args()
+
+    runner = run_direct if args.direct else run_stdio
+    asyncio.run(runner(args.sizes, args.scalar_limit))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Throughput of the learning server's named counters under concurrent clients.
+
+Spawns ``--clients`` learning servers over stdio (one per client, as agent
+hosts do), all sharing one throwaway counters database. Each client keeps
+``--concurrency`` increment calls in flight until it has made ``--calls``
+calls. Afterwards the servers are shut down and the totals on disk are
+checked against the number of increments sent, which verifies that coalesced
+writes from separate processes don't lose updates.
+
+Before that, the same increments are applied to a ``CounterStore`` in-process
+to show how much of the cost is the store itself rather than the protocol.
+
+``--batch N`` sends ``increment_counters`` calls touching N counters each
+instead of single ``increment_counter_by`` calls.
+
+Usage:
+    python benchmarks/counters_bench.py
+    python benchmarks/counters_bench.py --clients 8 --concurrency 16 --batch 10
+"""
+
+import argparse
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from mcp import ClientSession
+from mcp.client.stdio import stdio_client
+
+from servers import SERVERS
+
+sys.path.insert(0, str(SERVERS["learning_mcp"].path))
+from counters_store import CounterStore  # noqa: E402
+
+
+def store_only(db_path: Path, args: argparse.Namespace) -> float:
+    """Increments per second applied straight to a CounterStore."""
+    store = CounterStore(db_path)
+    names = [f"counter-{i}" for i in range(args.counters)]
+    total = args.clients * args.calls
+    start = time.perf_counter()
+    for i in range(total):
+        store.increment(names[i % len(names)])
+    store.close()
+    return total / (time.perf_counter() - start)
+
+
+async def run_client(env: dict, args: argparse.Namespace, ready: asyncio.Event,
+                     started: asyncio.Event) -> int:
+    """Drive one server; returns how many increments it sent."""
+    spec = SERVERS["learning_mcp"]
+    names = [f"counter-{i}" for i in range(args.counters)]
+    sent = 0
+    with open(os.devnull, "w") as devnull:
+        async with stdio_client(spec.stdio_params(env=env), errlog=devnull) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                ready.set()
+                await started.wait()
+
+                queue = iter(range(args.calls))
+
+                async def worker() -> None:
+                    nonlocal sent
+                    for i in queue:
+                        if args.batch:
+                            amounts = {names[(i + j) % len(names)]: 1 for j in range(args.batch)}
+                            result = await session.call_tool("increment_counters", {"amounts": amounts})
+                            sent += len(amounts)
+                        else:
+                            result = await session.call_tool(
+                                "increment_counter_by", {"amount": 1, "name": names[i % len(names)]})
+                            sent += 1
+                        if result.isError:
+                            raise RuntimeError(result.content)
+
+                await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    return sent
+
+
+async def run(args: argparse.Namespace) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"store only: {store_only(Path(tmp) / 'store-only.db', args):,.0f} increments/s")
+        db_path = Path(tmp) / "counters.db"
+        env = {"LEARNING_MCP_COUNTERS_DB": str(db_path)}
+        readies = [asyncio.Event() for _ in range(args.clients)]
+        started = asyncio.Event()
+        clients = [asyncio.create_task(run_client(env, args, ready, started)) for ready in readies]
+        await asyncio.gather(*(ready.wait() for ready in readies))
+
+        start = time.perf_counter()
+        started.set()
+        sent = sum(await asyncio.gather(*clients))
+        elapsed = time.perf_counter() - start
+
+        with sqlite3.connect(db_path) as conn:
+            stored = conn.execute("SELECT COALESCE(SUM(value), 0) FROM counters").fetchone()[0]
+
+    calls = args.clients * args.calls
+    print(f"clients={args.clients} concurrency={args.concurrency} "
+          f"batch={args.batch or 1} counters={args.counters}")
+    print(f"{calls} calls in {elapsed:.2f}s: {calls / elapsed:,.0f} calls/s, "
+          f"{sent / elapsed:,.0f} increments/s")
+    print(f"increments sent: {sent}, persisted: {stored} -> {'ok' if stored == sent else 'MISMATCH'}")
+    return 0 if stored == sent else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", type=int, default=4, help="server processes (default: 4)")
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="in-flight calls per client (default: 8)")
+    parser.add_argument("--calls", type=int, default=2_000, help="calls per client (default: 2000)")
+    parser.add_argument("--counters", type=int, default=16, help="distinct counter names (default: 16)")
+    parser.add_argument("--batch", type=int, default=0,
+                        help="counters per increment_counters call (default: single increments)")
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
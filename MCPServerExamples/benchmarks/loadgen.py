@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""End-to-end load generator for the example MCP servers.
+
+Drives a server the way an agent does: through an MCP ``ClientSession``, so
+every call pays for JSON-RPC framing, pydantic validation and the transport.
+By default each client spawns its own server over stdio (as agent hosts do);
+``--url`` connects to an already running server over streamable HTTP or SSE
+instead; every example server's ``main.py`` can serve those with
+``--transport streamable-http`` or ``--transport sse`` and ``--port``.
+
+Each client keeps ``--concurrency`` calls in flight, picking tools at random
+from a weighted mix, for ``--duration`` seconds or until ``--requests`` calls
+have been made. The report has throughput, p50/p90/p99 latency overall and
+per tool, and a time series of throughput, latency and server CPU/RSS.
+
+A mix is a JSON list, given inline or as a file path:
+
+    [{"tool": "say_hello", "args": {"name": "load"}, "weight": 3},
+     {"tool": "add_numbers", "args": {"a": 1, "b": 2}}]
+
+Usage:
+    python benchmarks/loadgen.py learning_mcp
+    python benchmarks/loadgen.py customer_service --clients 4 --concurrency 16 --duration 30
+    python benchmarks/loadgen.py learning_mcp --mix my_mix.json --json results.json
+    python learning_mcp/main.py --transport streamable-http --port 8000 &
+    python benchmarks/loadgen.py learning_mcp --url http://127.0.0.1:8000/mcp --server-pid $!
+
+Server CPU/RSS are read from /proc on Linux, or with psutil when installed.
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import math
+import os
+import random
+import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+
+from servers import SERVERS
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+_PROCESS_ERRORS = (OSError, IndexError, ValueError) + ((psutil.Error,) if psutil else ())
+
+# Read-only calls, so a load run doesn't leave notes or counters behind
+DEFAULT_MIXES: Dict[str, List[Dict[str, Any]]] = {
+    "learning_mcp": [
+        {"tool": "say_hello", "args": {"name": "load"}, "weight": 3},
+        {"tool": "add_numbers", "args": {"a": 2.5, "b": 4}, "weight": 3},
+        {"tool": "count_characters", "args": {"text": "The quick brown fox\njumps over the lazy dog"}, "weight": 2},
+        {"tool": "evaluate_expression", "args": {"expression": "sqrt(x**2 + y**2)", "variables": {"x": 3, "y": 4}}, "weight": 2},
+        {"tool": "get_current_time", "args": {}, "weight": 1},
+    ],
+    "customer_service": [
+        {"tool": "get_order_status", "args": {"order_id": "ORD-001"}, "weight": 4},
+        {"tool": "search_customer", "args": {"email": "jane.smith@email.com"}, "weight": 3},
+        {"tool": "get_customer_orders", "args": {"customer_id": "CUST-123"}, "weight": 2},
+        {"tool": "get_ticket_status", "args": {"ticket_id": "TKT-001"}, "weight": 1},
+    ],
+    # Both weather tools call api.weather.gov, so this mix measures the NWS API too
+    "weather": [
+        {"tool": "get_alerts", "args": {"state": "CA"}, "weight": 1},
+        {"tool": "get_forecast", "args": {"latitude": 40.7128, "longitude": -74.006}, "weight": 1},
+    ],
+}
+
+
+class LoadgenError(Exception):
+    """The run can't start: bad mix, unknown tools, unreachable server..."""
+
+
+@dataclass
+class Sample:
+    end: float
+    tool: str
+    latency: float
+    ok: bool
+
+
+@dataclass
+class ResourceSample:
+    time: float
+    cpu_percent: float
+    rss_bytes: int
+
+
+@dataclass
+class RunState:
+    deadline: float
+    remaining: Optional[int]
+    samples: List[Sample] = field(default_factory=list)
+    resources: List[ResourceSample] = field(default_factory=list)
+
+    def take(self) -> bool:
+        """Claim the next request slot; False once the run is over."""
+        if time.perf_counter() >= self.deadline:
+            return False
+        if self.remaining is not None:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+        return True
+
+
+def load_mix(value: Optional[str], server: Optional[str]) -> List[Dict[str, Any]]:
+    if value is None:
+        if server not in DEFAULT_MIXES:
+            raise LoadgenError("--mix is required when there is no default mix for the target")
+        return DEFAULT_MIXES[server]
+    try:
+        text = Path(value).read_text() if not value.lstrip().startswith("[") else value
+        mix = json.loads(text)
+    except OSError as e:
+        raise LoadgenError(f"Can't read --mix file {value}: {e.strerror}")
+    except json.JSONDecodeError as e:
+        raise LoadgenError(f"--mix is not valid JSON: {e}")
+    if not isinstance(mix, list) or not mix or not all(isinstance(c, dict) and "tool" in c for c in mix):
+        raise LoadgenError("--mix must be a non-empty JSON list of {\"tool\": ..., \"args\": ..., \"weight\": ...}")
+    for call in mix:
+        weight = call.get("weight", 1)
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) or not 0 <= weight < math.inf:
+            raise LoadgenError(f"Weight of {call['tool']} must be a non-negative number, not {weight!r}")
+    if not sum(call.get("weight", 1) for call in mix):
+        raise LoadgenError("At least one call in --mix needs a weight above 0")
+    return mix
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return math.nan
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+# --- server process sampling -------------------------------------------------
+
+def child_pids() -> set:
+    """PIDs of this process's direct children (the spawned stdio servers)."""
+    if psutil is not None:
+        return {child.pid for child in psutil.Process().children()}
+    pids = set()
+    for path in glob.glob("/proc/self/task/*/children"):
+        with open(path) as f:
+            pids.update(int(pid) for pid in f.read().split())
+    return pids
+
+
+def read_process(pid: int) -> Optional[Tuple[float, int]]:
+    """Return (CPU seconds used, RSS bytes) for a process, or None if unavailable."""
+    try:
+        if psutil is not None:
+            proc = psutil.Process(pid)
+            times = proc.cpu_times()
+            return times.user + times.system, proc.memory_info().rss
+        with open(f"/proc/{pid}/stat") as f:
+            # Fields after the ")" closing the command name; utime/stime are 14th/15th overall
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open(f"/proc/{pid}/statm") as f:
+            rss_pages = int(f.read().split()[1])
+        ticks = os.sysconf("SC_CLK_TCK")
+        return (int(fields[11]) + int(fields[12])) / ticks, rss_pages * os.sysconf("SC_PAGE_SIZE")
+    except _PROCESS_ERRORS:
+        return None
+
+
+async def sample_resources(pids: Sequence[int], state: RunState, start: float, interval: float) -> None:
+    """Record total CPU% and RSS of the server processes every ``interval`` seconds."""
+    last_time = time.perf_counter()
+    last_cpu = {pid: read_process(pid) for pid in pids}
+    while True:
+        await asyncio.sleep(interval)
+        now = time.perf_counter()
+        cpu_used = 0.0
+        rss = 0
+        for pid in pids:
+            current = read_process(pid)
+            if current is None:
+                continue
+            previous = last_cpu.get(pid)
+            if previous is not None:
+                cpu_used += current[0] - previous[0]
+            rss += current[1]
+            last_cpu[pid] = current
+        state.resources.append(ResourceSample(now - start, 100 * cpu_used / (now - last_time), rss))
+        last_time = now
+
+
+# --- clients -----------------------------------------------------------------
+
+@asynccontextmanager
+async def connect(args: argparse.Namespace) -> AsyncIterator[ClientSession]:
+    """Open an initialized session to the target server."""
+    if args.url:
+        if args.transport == "sse":
+            transport = sse_client(args.url)
+        else:
+            transport = streamablehttp_client(args.url)
+        async with transport as streams:
+            async with ClientSession(streams[0], streams[1]) as session:
+                await session.initialize()
+                yield session
+        return
+
+    spec = SERVERS[args.server]
+    with open(os.devnull, "w") as devnull:
+        params = spec.stdio_params(python=args.python, script=args.script)
+        async with stdio_client(params, errlog=devnull) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                yield session
+
+
+def root_cause(exc: BaseException) -> BaseException:
+    """The first leaf of a (possibly nested) exception group."""
+    while getattr(exc, "exceptions", None):
+        exc = exc.exceptions[0]
+    return exc
+
+
+async def run_client(args: argparse.Namespace, mix: List[Dict[str, Any]], state: RunState,
+                     ready: asyncio.Event, started: asyncio.Event, seed: int) -> None:
+    try:
+        async with connect(args) as session:
+            available = {tool.name for tool in (await session.list_tools()).tools}
+            unknown = sorted({call["tool"] for call in mix} - available)
+            if not unknown:
+                await drive_session(session, args, mix, state, ready, started, seed)
+    except Exception as e:
+        # Transport failures arrive wrapped in anyio task group errors; report the cause
+        cause = root_cause(e)
+        detail = f"{type(cause).__name__}: {cause}" if str(cause) else type(cause).__name__
+        target = args.url or f"{args.server} ({args.script})"
+        if ready.is_set():
+            raise LoadgenError(f"Lost the session with {target} during the run ({detail})") from e
+        hint = "" if args.url else " Run the server directly to see its output."
+        raise LoadgenError(f"Could not start a session with {target} ({detail}).{hint}") from e
+    # Raised outside the session so it isn't wrapped in the transport's task group errors
+    if unknown:
+        raise LoadgenError(f"Unknown tool(s) in mix: {', '.join(unknown)}. "
+                           f"Server offers: {', '.join(sorted(available))}")
+
+
+async def drive_session(session: ClientSession, args: argparse.Namespace, mix: List[Dict[str, Any]],
+                        state: RunState, ready: asyncio.Event, started: asyncio.Event, seed: int) -> None:
+    """Wait for the start signal, then keep ``--concurrency`` calls in flight."""
+    ready.set()
+    await started.wait()
+
+    rng = random.Random(seed)
+    weights = [call.get("weight", 1) for call in mix]
+
+    async def worker() -> None:
+        while state.take():
+            call = rng.choices(mix, weights)[0]
+            begin = time.perf_counter()
+            try:
+                result = await session.call_tool(call["tool"], call.get("args", {}))
+                ok = not result.isError
+            except Exception:
+                ok = False
+            end = time.perf_counter()
+            state.samples.append(Sample(end, call["tool"], end - begin, ok))
+
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+
+
+# --- reporting ---------------------------------------------------------------
+
+def latency_summary(latencies: List[float]) -> Dict[str, float]:
+    latencies = sorted(latencies)
+    return {
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p90_ms": percentile(latencies, 90) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": (latencies[-1] if latencies else math.nan) * 1000,
+    }
+
+
+def build_report(args: argparse.Namespace, state: RunState, start: float, elapsed: float) -> Dict[str, Any]:
+    samples = state.samples
+    ok = [s for s in samples if s.ok]
+    report: Dict[str, Any] = {
+        "target": args.url or f"{args.server} ({args.script or SERVERS[args.server].module + '.py'} over stdio)",
+        "clients": args.clients,
+        "concurrency": args.concurrency,
+        "elapsed_s": elapsed,
+        "requests": len(samples),
+        "errors": len(samples) - len(ok),
+        "throughput_rps": len(samples) / elapsed if elapsed else 0.0,
+        "latency": latency_summary([s.latency for s in ok]),
+        "tools": {},
+        "timeline": [],
+    }
+    for tool in sorted({s.tool for s in samples}):
+        calls = [s for s in samples if s.tool == tool]
+        report["tools"][tool] = {
+            "requests": len(calls),
+            "errors": sum(1 for s in calls if not s.ok),
+            **latency_summary([s.latency for s in calls if s.ok]),
+        }
+
+    # Split the run up to the deadline into equal buckets close to --interval, so
+    # there's no short trailing bucket; calls finishing after the deadline only
+    # count towards the totals above.
+    covered = min(elapsed, args.duration)
+    count = max(1, round(covered / args.interval))
+    width = covered / count
+    buckets: Dict[int, List[Sample]] = {}
+    for s in samples:
+        offset = s.end - start
+        if offset <= covered:
+            buckets.setdefault(min(int(offset / width), count - 1), []).append(s)
+    resources = {int(r.time / width + 0.5) - 1: r for r in state.resources}
+    for index in range(count):
+        bucket = buckets.get(index, [])
+        resource = resources.get(index)
+        report["timeline"].append({
+            "t_s": (index + 1) * width,
+            "rps": len(bucket) / width,
+            **{k: v for k, v in latency_summary([s.latency for s in bucket if s.ok]).items()
+               if k in ("p50_ms", "p99_ms")},
+            "cpu_percent": resource.cpu_percent if resource else None,
+            "rss_mb": resource.rss_bytes / 2**20 if resource else None,
+        })
+    return report
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    lat = report["latency"]
+    print(f"== {report['target']}: {report['clients']} client(s) x {report['concurrency']} in flight, "
+          f"{report['elapsed_s']:.1f}s ==")
+    print(f"requests: {report['requests']} ({report['errors']} errors), "
+          f"throughput: {report['throughput_rps']:.1f} req/s")
+    print(f"latency: p50 {lat['p50_ms']:.2f} ms, p90 {lat['p90_ms']:.2f} ms, "
+          f"p99 {lat['p99_ms']:.2f} ms, max {lat['max_ms']:.2f} ms")
+    print()
+    print(f"{'tool':<28} {'requests':>9} {'errors':>7} {'p50 ms':>9} {'p99 ms':>9}")
+    for tool, stats in report["tools"].items():
+        print(f"{tool:<28} {stats['requests']:>9} {stats['errors']:>7} "
+              f"{stats['p50_ms']:>9.2f} {stats['p99_ms']:>9.2f}")
+    print()
+    print(f"{'t (s)':>6} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'cpu %':>7} {'rss MB':>8}")
+    for row in report["timeline"]:
+        cpu = f"{row['cpu_percent']:>7.1f}" if row["cpu_percent"] is not None else f"{'-':>7}"
+        rss = f"{row['rss_mb']:>8.1f}" if row["rss_mb"] is not None else f"{'-':>8}"
+        print(f"{row['t_s']:>6.1f} {row['rps']:>9.1f} {row['p50_ms']:>9.2f} {row['p99_ms']:>9.2f} {cpu} {rss}")
+
+
+async def run(args: argparse.Namespace) -> int:
+    mix = load_mix(args.mix, args.server)
+    before = child_pids() if not args.url else set()
+
+    readies = [asyncio.Event() for _ in range(args.clients)]
+    started = asyncio.Event()
+    state = RunState(deadline=math.inf, remaining=args.requests)
+    clients = [asyncio.create_task(run_client(args, mix, state, ready, started, seed))
+               for seed, ready in enumerate(readies)]
+    all_ready = asyncio.create_task(asyncio.wait([asyncio.create_task(r.wait()) for r in readies]))
+    done, _ = await asyncio.wait([all_ready, *clients], return_when=asyncio.FIRST_COMPLETED)
+    if all_ready not in done:
+        # A client gave up before the run started: stop the rest and report why
+        all_ready.cancel()
+        for client in clients:
+            client.cancel()
+        await asyncio.gather(all_ready, *clients, return_exceptions=True)
+        for client in done:
+            client.result()
+        return 1
+
+    pids = sorted(child_pids() - before) if not args.url else args.server_pid
+    start = time.perf_counter()
+    state.deadline = start + args.duration
+    sampler = asyncio.create_task(sample_resources(pids, state, start, args.interval))
+    started.set()
+    await asyncio.gather(*clients)
+    elapsed = time.perf_counter() - start
+    sampler.cancel()
+
+    report = build_report(args, state, start, elapsed)
+    print_report(report)
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+    return 0 if report["errors"] == 0 else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("server", nargs="?", choices=sorted(SERVERS),
+                        help="example server to spawn over stdio (also picks the default mix)")
+    parser.add_argument("--script", default="main.py",
+                        help="script to spawn in the server's directory (default: main.py)")
+    parser.add_argument("--python", default=sys.executable, help="interpreter used to run the server")
+    parser.add_argument("--url", help="connect to a running server at this URL instead of spawning one")
+    parser.add_argument("--transport", choices=["streamable-http", "sse"], default="streamable-http",
+                        help="network transport for --url (default: streamable-http)")
+    parser.add_argument("--server-pid", type=int, nargs="*", default=[],
+                        help="PIDs to sample CPU/RSS from when using --url")
+    parser.add_argument("--mix", help="tool-call mix as inline JSON or a path to a JSON file")
+    parser.add_argument("--clients", type=int, default=1,
+                        help="client sessions; with stdio, one server process each (default: 1)")
+    parser.add_argument("--concurrency", type=int, default=8, help="in-flight calls per client (default: 8)")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run (default: 10)")
+    parser.add_argument("--requests", type=int, help="stop after this many calls in total")
+    parser.add_argument("--interval", type=float, default=1.0, help="time series resolution in seconds (default: 1)")
+    parser.add_argument("--json", help="also write the full report to this file")
+    args = parser.parse_args()
+    if not args.server and not args.url:
+        parser.error("give a server to spawn or --url to connect to")
+    try:
+        return asyncio.run(run(args))
+    except LoadgenError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
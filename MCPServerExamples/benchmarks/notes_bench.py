@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Per-call latency of the learning server's notes store as it grows.
+
+Fills a throwaway SQLite database in steps (10k, 100k, 1M notes by default)
+and after each step times ``list``, ``search`` and ``delete`` at the start,
+middle and end of the ID range. With cursor pagination and the inverted index
+these numbers should stay flat as the store grows.
+
+Most notes use a small set of common words; about one in ten thousand also
+contains a rare word. The mixed searches put the common word first ("milk
+zebra", "milk nothinghere"), which is only fast if the search walks the
+rarest term's postings rather than the first term's.
+
+Usage:
+    python benchmarks/notes_bench.py
+    python benchmarks/notes_bench.py --sizes 1000 10000 --calls 50
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from servers import SERVERS
+
+sys.path.insert(0, str(SERVERS["learning_mcp"].path))
+from notes_store import NotesStore  # noqa: E402
+
+WORDS = ("milk eggs bread call mom meeting review deploy fix bug write docs "
+         "plan trip book flight pay rent water plants gym read chapter").split()
+RARE_WORD = "zebra"
+RARE_RATE = 1 / 10_000
+
+
+def random_note(rng: random.Random) -> str:
+    words = rng.choices(WORDS, k=rng.randint(3, 10))
+    if rng.random() < RARE_RATE:
+        words.append(RARE_WORD)
+    return " ".join(words)
+
+
+def time_calls(fn, calls: int) -> float:
+    """Median wall time of ``fn`` over ``calls`` invocations, in milliseconds."""
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="store sizes to measure at (default: 10k 100k 1M)")
+    parser.add_argument("--calls", type=int, default=200, help="calls per measurement (default: 200)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = NotesStore(Path(tmp) / "notes.db")
+        size = 0
+        print(f"{'notes':>10} {'list first':>11} {'list mid':>9} {'list last':>10} "
+              f"{'search 1w':>10} {'search 2w':>10} {'common+rare':>12} {'common+none':>12} "
+              f"{'delete':>8}   (median ms)")
+        for target in sorted(args.sizes):
+            start = time.perf_counter()
+            size += store.add_many(random_note(rng) for _ in range(target - size))
+            fill = time.perf_counter() - start
+
+            last_id = store.conn.execute("SELECT MAX(id) FROM notes").fetchone()[0]
+            mid = last_id // 2
+            row = [
+                time_calls(lambda: store.list(0, 20), args.calls),
+                time_calls(lambda: store.list(mid, 20), args.calls),
+                time_calls(lambda: store.list(last_id - 10, 20), args.calls),
+                time_calls(lambda: store.search("milk", mid, 20), args.calls),
+                time_calls(lambda: store.search("milk eggs", mid, 20), args.calls),
+                time_calls(lambda: store.search(f"milk {RARE_WORD}", 0, 20), args.calls),
+                time_calls(lambda: store.search("milk nothinghere", 0, 20), args.calls),
+            ]
+            victims = iter(rng.sample(range(1, last_id + 1), args.calls))
+            row.append(time_calls(lambda: store.delete(next(victims)), args.calls))
+            size -= args.calls
+            size += store.add_many(random_note(rng) for _ in range(args.calls))
+
+            print(f"{target:>10} " + " ".join(f"{ms:>{w}.3f}" for ms, w in zip(row, (11, 9, 10, 10, 10, 12, 12, 8)))
+                  + f"   (filled in {fill:.1f}s)")
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""Shared registry of the example MCP servers used by the benchmark scripts."""
+
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from mcp import StdioServerParameters
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent
+
+
+@dataclass(frozen=True)
+class ServerSpec:
+    """How to launch one example server and which call to use as a probe."""
+
+    directory: str
+    module: str
+    probe_tool: Optional[str] = None
+    probe_args: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def path(self) -> Path:
+        return EXAMPLES_DIR / self.directory
+
+    def stdio_params(self, python: str = sys.executable, env: Optional[Dict[str, str]] = None,
+                     script: Optional[str] = None) -> StdioServerParameters:
+        """Parameters for spawning this server over stdio, the way an agent host would.
+
+        ``script`` defaults to the server module itself; pass ``"main.py"`` to go
+        through the entry point instead.
+        """
+        return StdioServerParameters(
+            command=python,
+            args=[script or f"{self.module}.py"],
+            cwd=str(self.path),
+            env=env,
+        )
+
+
+SERVERS: Dict[str, ServerSpec] = {
+    "learning_mcp": ServerSpec(
+        directory="learning_mcp",
+        module="learning_mcp",
+        probe_tool="say_hello",
+        probe_args={"name": "bench"},
+    ),
+    "customer_service": ServerSpec(
+        directory="customer_service",
+        module="customer_service",
+        probe_tool="get_order_status",
+        probe_args={"order_id": "ORD-001"},
+    ),
+    # Every weather tool hits api.weather.gov, so the probe is tools/list instead
+    "weather": ServerSpec(directory="weather", module="weather"),
+}
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Cold-start benchmark for the example MCP servers.
+
+Agent hosts spawn these stdio servers on demand, so the time from launching the
+process to getting the first tool result back is latency the user sees. This
+script reports two numbers per server:
+
+* import cost, from ``python -X importtime -c "import <server>"``, with the
+  heaviest direct imports of the server module broken out;
+* time to first tool response, measured by a scripted stdio client that spawns
+  the server, runs the MCP handshake and makes one probe call.
+
+Usage:
+    python benchmarks/startup.py                       # all servers
+    python benchmarks/startup.py learning_mcp --runs 10
+    python benchmarks/startup.py --target-ms 800       # fail if slower
+
+Run it with an interpreter that has the servers' dependencies installed, e.g.
+``uv run --directory learning_mcp python ../benchmarks/startup.py``.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+from mcp import ClientSession
+from mcp.client.stdio import stdio_client
+
+from servers import SERVERS, ServerSpec
+
+# Time-to-first-tool-response budget (median over runs) for a spawned server
+DEFAULT_TARGET_MS = 1500.0
+
+
+def measure_import_time(spec: ServerSpec, python: str) -> Tuple[int, List[Tuple[str, int]]]:
+    """Return the server module's cumulative import time and its direct imports (µs)."""
+    cmd = [python, "-X", "importtime", "-c", f"import {spec.module}"]
+    # First run warms the bytecode cache so we measure imports, not compilation
+    subprocess.run(cmd, cwd=spec.path, capture_output=True, check=True)
+    proc = subprocess.run(cmd, cwd=spec.path, capture_output=True, text=True, check=True)
+
+    total = 0
+    children: List[Tuple[str, int]] = []
+    pending: List[Tuple[str, int]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        name = name.strip()
+        if depth == 0:
+            if name == spec.module:
+                total = int(cumulative)
+                children = pending
+            pending = []
+        elif depth == 1:
+            pending.append((name, int(cumulative)))
+
+    children.sort(key=lambda item: item[1], reverse=True)
+    return total, children
+
+
+async def measure_first_response(spec: ServerSpec, python: str) -> Tuple[float, float]:
+    """Spawn the server and return (seconds to initialized, seconds to first result)."""
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull:
+        async with stdio_client(spec.stdio_params(python), errlog=devnull) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                initialized = time.perf_counter()
+                if spec.probe_tool:
+                    result = await session.call_tool(spec.probe_tool, spec.probe_args)
+                    if result.isError:
+                        raise RuntimeError(f"probe {spec.probe_tool} failed: {result.content}")
+                else:
+                    await session.list_tools()
+                done = time.perf_counter()
+    return initialized - start, done - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("servers", nargs="*", metavar="server",
+                        help=f"servers to measure: {', '.join(SERVERS)} (default: all)")
+    parser.add_argument("--runs", type=int, default=5, help="spawns per server (default: 5)")
+    parser.add_argument("--top", type=int, default=8, help="direct imports to list (default: 8)")
+    parser.add_argument("--target-ms", type=float, default=DEFAULT_TARGET_MS,
+                        help=f"median time-to-first-response budget (default: {DEFAULT_TARGET_MS:.0f})")
+    parser.add_argument("--python", default=sys.executable, help="interpreter used to run the servers")
+    args = parser.parse_args()
+    unknown = sorted(set(args.servers) - set(SERVERS))
+    if unknown:
+        parser.error(f"unknown server(s): {', '.join(unknown)}")
+
+    over_budget = []
+    for name in args.servers or SERVERS:
+        spec = SERVERS[name]
+        total_us, children = measure_import_time(spec, args.python)
+        print(f"== {name} ==")
+        print(f"import {spec.module}: {total_us / 1000:.1f} ms")
+        for child, cumulative in children[:args.top]:
+            print(f"  {child:<40} {cumulative / 1000:8.1f} ms")
+
+        samples = [asyncio.run(measure_first_response(spec, args.python)) for _ in range(args.runs)]
+        init_ms = statistics.median(s[0] for s in samples) * 1000
+        first_ms = statistics.median(s[1] for s in samples) * 1000
+        probe = f"call_tool({spec.probe_tool})" if spec.probe_tool else "list_tools()"
+        status = "ok" if first_ms <= args.target_ms else "OVER BUDGET"
+        print(f"spawn -> initialized: {init_ms:.1f} ms (median of {args.runs})")
+        print(f"spawn -> first {probe}: {first_ms:.1f} ms "
+              f"[target {args.target_ms:.0f} ms: {status}]")
+        print()
+        if first_ms > args.target_ms:
+            over_budget.append(name)
+
+    if over_budget:
+        print(f"Over budget: {', '.join(over_budget)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
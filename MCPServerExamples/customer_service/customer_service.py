@@ -1,6 +1,7 @@
 from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
-import json
+from datetime import datetime
+from functools import cache
+import sys
 from mcp.server.fastmcp import FastMCP
 from enum import Enum
 
@@ -29,81 +30,103 @@ class Priority(str, Enum):
     HIGH = "high"
     URGENT = "urgent"
 
-# Mock database - In a real implementation, this would be a proper database
-ORDERS_DB = {
-    "ORD-001": {
-        "order_id": "ORD-001",
-        "customer_id": "CUST-123",
-        "customer_email": "john.doe@email.com",
-        "customer_name": "John Doe",
-        "items": [
-            {"product": "Laptop", "quantity": 1, "price": 999.99},
-            {"product": "Mouse", "quantity": 1, "price": 29.99}
-        ],
-        "total": 1029.98,
-        "status": OrderStatus.SHIPPED,
-        "order_date": "2025-06-20",
-        "tracking_number": "TRK123456789",
-        "estimated_delivery": "2025-06-28",
-        "shipping_address": "123 Main St, Anytown, ST 12345"
-    },
-    "ORD-002": {
-        "order_id": "ORD-002",
-        "customer_id": "CUST-456",
-        "customer_email": "jane.smith@email.com",
-        "customer_name": "Jane Smith",
-        "items": [
-            {"product": "Smartphone", "quantity": 1, "price": 699.99}
-        ],
-        "total": 699.99,
-        "status": OrderStatus.PROCESSING,
-        "order_date": "2025-06-25",
-        "tracking_number": None,
-        "estimated_delivery": "2025-06-30",
-        "shipping_address": "456 Oak Ave, Another City, ST 67890"
+# Mock database - In a real implementation, this would be a proper database.
+# Each table is built on first use so importing the server stays cheap.
+@cache
+def _orders_db() -> Dict[str, Dict[str, Any]]:
+    """Return the mock orders table, building it on first use."""
+    return {
+        "ORD-001": {
+            "order_id": "ORD-001",
+            "customer_id": "CUST-123",
+            "customer_email": "john.doe@email.com",
+            "customer_name": "John Doe",
+            "items": [
+                {"product": "Laptop", "quantity": 1, "price": 999.99},
+                {"product": "Mouse", "quantity": 1, "price": 29.99}
+            ],
+            "total": 1029.98,
+            "status": OrderStatus.SHIPPED,
+            "order_date": "2025-06-20",
+            "tracking_number": "TRK123456789",
+            "estimated_delivery": "2025-06-28",
+            "shipping_address": "123 Main St, Anytown, ST 12345"
+        },
+        "ORD-002": {
+            "order_id": "ORD-002",
+            "customer_id": "CUST-456",
+            "customer_email": "jane.smith@email.com",
+            "customer_name": "Jane Smith",
+            "items": [
+                {"product": "Smartphone", "quantity": 1, "price": 699.99}
+            ],
+            "total": 699.99,
+            "status": OrderStatus.PROCESSING,
+            "order_date": "2025-06-25",
+            "tracking_number": None,
+            "estimated_delivery": "2025-06-30",
+            "shipping_address": "456 Oak Ave, Another City, ST 67890"
+        }
     }
-}
 
-TICKETS_DB = {
-    "TKT-001": {
-        "ticket_id": "TKT-001",
-        "customer_id": "CUST-123",
-        "customer_email": "john.doe@email.com",
-        "customer_name": "John Doe",
-        "subject": "Damaged item received",
-        "description": "The laptop I received has a crack on the screen",
-        "status": TicketStatus.OPEN,
-        "priority": Priority.HIGH,
-        "created_date": "2025-06-26",
-        "last_updated": "2025-06-26",
-        "agent_assigned": None,
-        "order_id": "ORD-001"
+@cache
+def _tickets_db() -> Dict[str, Dict[str, Any]]:
+    """Return the mock support tickets table, building it on first use."""
+    return {
+        "TKT-001": {
+            "ticket_id": "TKT-001",
+            "customer_id": "CUST-123",
+            "customer_email": "john.doe@email.com",
+            "customer_name": "John Doe",
+            "subject": "Damaged item received",
+            "description": "The laptop I received has a crack on the screen",
+            "status": TicketStatus.OPEN,
+            "priority": Priority.HIGH,
+            "created_date": "2025-06-26",
+            "last_updated": "2025-06-26",
+            "agent_assigned": None,
+            "order_id": "ORD-001"
+        }
     }
-}
 
-CUSTOMERS_DB = {
-    "CUST-123": {
-        "customer_id": "CUST-123",
-        "name": "John Doe",
-        "email": "john.doe@email.com",
-        "phone": "+1-555-0123",
-        "registration_date": "2024-01-15",
-        "loyalty_tier": "Gold",
-        "total_orders": 15,
-        "total_spent": 5999.85
-    },
-    "CUST-456": {
-        "customer_id": "CUST-456",
-        "name": "Jane Smith",
-        "email": "jane.smith@email.com",
-        "phone": "+1-555-0456",
-        "registration_date": "2024-03-22",
-        "loyalty_tier": "Silver",
-        "total_orders": 8,
-        "total_spent": 2799.92
+@cache
+def _customers_db() -> Dict[str, Dict[str, Any]]:
+    """Return the mock customers table, building it on first use."""
+    return {
+        "CUST-123": {
+            "customer_id": "CUST-123",
+            "name": "John Doe",
+            "email": "john.doe@email.com",
+            "phone": "+1-555-0123",
+            "registration_date": "2024-01-15",
+            "loyalty_tier": "Gold",
+            "total_orders": 15,
+            "total_spent": 5999.85
+        },
+        "CUST-456": {
+            "customer_id": "CUST-456",
+            "name": "Jane Smith",
+            "email": "jane.smith@email.com",
+            "phone": "+1-555-0456",
+            "registration_date": "2024-03-22",
+            "loyalty_tier": "Silver",
+            "total_orders": 8,
+            "total_spent": 2799.92
+        }
     }
+
+_LAZY_TABLES = {
+    "ORDERS_DB": _orders_db,
+    "TICKETS_DB": _tickets_db,
+    "CUSTOMERS_DB": _customers_db,
 }
 
+def __getattr__(name: str) -> Any:
+    """Keep ``customer_service.ORDERS_DB`` style access working for importers."""
+    if name in _LAZY_TABLES:
+        return _LAZY_TABLES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 @mcp.tool()
 async def get_order_status(order_id: str) -> str:
     """Get the current status and details of an order.
@@ -111,10 +134,10 @@ async def get_order_status(order_id: str) -> str:
     Args:
         order_id: The order ID to look up (e.g., ORD-001)
     """
-    if order_id not in ORDERS_DB:
+    if order_id not in _orders_db():
         return f"Order {order_id} not found. Please check the order ID and try again."
     
-    order = ORDERS_DB[order_id]
+    order = _orders_db()[order_id]
     
     items_list = "\n".join([
         f"  - {item['product']} (Qty: {item['quantity']}) - ${item['price']:.2f}"
@@ -147,10 +170,10 @@ async def cancel_order(order_id: str, reason: str = "Customer request") -> str:
         order_id: The order ID to cancel
         reason: Reason for cancellation (optional)
     """
-    if order_id not in ORDERS_DB:
+    if order_id not in _orders_db():
         return f"Order {order_id} not found. Please check the order ID and try again."
     
-    order = ORDERS_DB[order_id]
+    order = _orders_db()[order_id]
     current_status = order['status']
     
     # Check if order can be cancelled
@@ -161,9 +184,9 @@ async def cancel_order(order_id: str, reason: str = "Customer request") -> str:
         return f"Order {order_id} is already cancelled."
     
     # Cancel the order
-    ORDERS_DB[order_id]['status'] = OrderStatus.CANCELLED
-    ORDERS_DB[order_id]['cancellation_reason'] = reason
-    ORDERS_DB[order_id]['cancellation_date'] = datetime.now().strftime("%Y-%m-%d")
+    _orders_db()[order_id]['status'] = OrderStatus.CANCELLED
+    _orders_db()[order_id]['cancellation_reason'] = reason
+    _orders_db()[order_id]['cancellation_date'] = datetime.now().strftime("%Y-%m-%d")
     
     return f"""
 Order {order_id} has been successfully cancelled.
@@ -189,12 +212,12 @@ async def search_customer(email: str = None, customer_id: str = None, phone: str
         return "Please provide at least one search parameter: email, customer_id, or phone."
     
     # Search by customer_id first (most direct)
-    if customer_id and customer_id in CUSTOMERS_DB:
-        customer = CUSTOMERS_DB[customer_id]
+    if customer_id and customer_id in _customers_db():
+        customer = _customers_db()[customer_id]
     else:
         # Search by email or phone
         customer = None
-        for cust_id, cust_data in CUSTOMERS_DB.items():
+        for cust_id, cust_data in _customers_db().items():
             if (email and cust_data['email'].lower() == email.lower()) or \
                (phone and cust_data['phone'] == phone):
                 customer = cust_data
@@ -204,7 +227,7 @@ async def search_customer(email: str = None, customer_id: str = None, phone: str
         return "Customer not found. Please check the search parameters and try again."
     
     # Get customer's orders
-    customer_orders = [order for order in ORDERS_DB.values() 
+    customer_orders = [order for order in _orders_db().values() 
                       if order['customer_id'] == customer['customer_id']]
     
     recent_orders = sorted(customer_orders, key=lambda x: x['order_date'], reverse=True)[:3]
@@ -241,7 +264,7 @@ async def create_support_ticket(customer_id: str, subject: str, description: str
         priority: Priority level (low, medium, high, urgent)
         order_id: Related order ID if applicable
     """
-    if customer_id not in CUSTOMERS_DB:
+    if customer_id not in _customers_db():
         return f"Customer {customer_id} not found. Please verify the customer ID."
     
     # Validate priority
@@ -251,10 +274,10 @@ async def create_support_ticket(customer_id: str, subject: str, description: str
         return f"Invalid priority '{priority}'. Must be one of: low, medium, high, urgent"
     
     # Generate new ticket ID
-    ticket_count = len(TICKETS_DB) + 1
+    ticket_count = len(_tickets_db()) + 1
     ticket_id = f"TKT-{ticket_count:03d}"
     
-    customer = CUSTOMERS_DB[customer_id]
+    customer = _customers_db()[customer_id]
     
     # Create ticket
     new_ticket = {
@@ -272,7 +295,7 @@ async def create_support_ticket(customer_id: str, subject: str, description: str
         "order_id": order_id
     }
     
-    TICKETS_DB[ticket_id] = new_ticket
+    _tickets_db()[ticket_id] = new_ticket
     
     order_info = f"\nRelated Order: {order_id}" if order_id else ""
     
@@ -298,10 +321,10 @@ async def get_ticket_status(ticket_id: str) -> str:
     Args:
         ticket_id: The ticket ID to look up (e.g., TKT-001)
     """
-    if ticket_id not in TICKETS_DB:
+    if ticket_id not in _tickets_db():
         return f"Ticket {ticket_id} not found. Please check the ticket ID and try again."
     
-    ticket = TICKETS_DB[ticket_id]
+    ticket = _tickets_db()[ticket_id]
     
     agent_info = f"Assigned Agent: {ticket['agent_assigned']}" if ticket['agent_assigned'] else "Agent: Not yet assigned"
     order_info = f"\nRelated Order: {ticket['order_id']}" if ticket['order_id'] else ""
@@ -330,10 +353,10 @@ async def process_refund(order_id: str, amount: float = None, reason: str = "Cus
         amount: Partial refund amount (optional, defaults to full order total)
         reason: Reason for the refund
     """
-    if order_id not in ORDERS_DB:
+    if order_id not in _orders_db():
         return f"Order {order_id} not found. Please check the order ID and try again."
     
-    order = ORDERS_DB[order_id]
+    order = _orders_db()[order_id]
     
     if order['status'] not in [OrderStatus.DELIVERED, OrderStatus.CANCELLED]:
         return f"Cannot process refund for order {order_id}. Order status is {order['status']}. Order must be delivered or cancelled to process refund."
@@ -344,10 +367,10 @@ async def process_refund(order_id: str, amount: float = None, reason: str = "Cus
         return f"Refund amount ${refund_amount:.2f} cannot exceed order total ${order['total']:.2f}."
     
     # Process refund
-    ORDERS_DB[order_id]['status'] = OrderStatus.REFUNDED
-    ORDERS_DB[order_id]['refund_amount'] = refund_amount
-    ORDERS_DB[order_id]['refund_reason'] = reason
-    ORDERS_DB[order_id]['refund_date'] = datetime.now().strftime("%Y-%m-%d")
+    _orders_db()[order_id]['status'] = OrderStatus.REFUNDED
+    _orders_db()[order_id]['refund_amount'] = refund_amount
+    _orders_db()[order_id]['refund_reason'] = reason
+    _orders_db()[order_id]['refund_date'] = datetime.now().strftime("%Y-%m-%d")
     
     refund_type = "Full" if refund_amount == order['total'] else "Partial"
     
@@ -372,17 +395,17 @@ async def update_shipping_address(order_id: str, new_address: str) -> str:
         order_id: The order ID to update
         new_address: The new shipping address
     """
-    if order_id not in ORDERS_DB:
+    if order_id not in _orders_db():
         return f"Order {order_id} not found. Please check the order ID and try again."
     
-    order = ORDERS_DB[order_id]
+    order = _orders_db()[order_id]
     
     if order['status'] in [OrderStatus.SHIPPED, OrderStatus.DELIVERED]:
         return f"Cannot update shipping address for order {order_id}. Order is already {order['status']}."
     
     old_address = order['shipping_address']
-    ORDERS_DB[order_id]['shipping_address'] = new_address
-    ORDERS_DB[order_id]['address_updated_date'] = datetime.now().strftime("%Y-%m-%d")
+    _orders_db()[order_id]['shipping_address'] = new_address
+    _orders_db()[order_id]['address_updated_date'] = datetime.now().strftime("%Y-%m-%d")
     
     return f"""
 Shipping Address Updated Successfully!
@@ -404,11 +427,11 @@ async def get_customer_orders(customer_id: str, limit: int = 10) -> str:
         customer_id: The customer's ID
         limit: Maximum number of orders to return (default: 10)
     """
-    if customer_id not in CUSTOMERS_DB:
+    if customer_id not in _customers_db():
         return f"Customer {customer_id} not found. Please check the customer ID and try again."
     
-    customer = CUSTOMERS_DB[customer_id]
-    customer_orders = [order for order in ORDERS_DB.values() 
+    customer = _customers_db()[customer_id]
+    customer_orders = [order for order in _orders_db().values() 
                       if order['customer_id'] == customer_id]
     
     if not customer_orders:
@@ -439,5 +462,5 @@ Customer Summary:
 
 if __name__ == "__main__":
     # Initialize and run the server
-    print("Starting customer service MCP server...")
+    print("Starting customer service MCP server...", file=sys.stderr)
     mcp.run(transport='stdio')
@@ -0,0 +1,247 @@
+"""Vectorised helpers behind the learning server's batch math tools.
+
+Values come either as an array or as one column of inline CSV, ndjson or a
+JSON array passed as ``data``. Everything is computed with NumPy in one pass.
+Bad elements (missing, non-numeric, outside the operation's domain, or
+overflowing to infinity) become NaN and are reported by index instead of
+failing the whole batch.
+
+NumPy is imported on first use so the server's cold start doesn't pay for it.
+"""
+
+import csv
+import io
+import json
+import math
+from typing import Any, List, Optional, Sequence, Tuple
+
+# Largest batch a single call will accept
+MAX_BATCH_SIZE = 1_000_000
+
+# Largest page of results a single call returns (see offset/limit)
+MAX_LISTED = 10_000
+# How many flagged indices to print before summarising the rest
+MAX_FLAGGED_LISTED = 20
+
+
+class BatchError(ValueError):
+    """The batch as a whole can't be processed (bad shape, missing column...)."""
+
+
+def _np():
+    import numpy
+    return numpy
+
+
+def _to_float(value: Any) -> float:
+    if value is None or isinstance(value, bool):
+        return float("nan")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _column_from_data(data: str, column: Optional[str]) -> List[float]:
+    """Pull one column out of inline CSV (with a header row), ndjson or a JSON array."""
+    text = data.strip()
+    if not text:
+        raise BatchError("data is empty")
+
+    if text.startswith("["):
+        try:
+            records = json.loads(text)
+        except json.JSONDecodeError:
+            raise BatchError("data looks like a JSON array but is not valid JSON")
+        if column is None:
+            if any(isinstance(record, dict) for record in records):
+                raise BatchError("column is required for a JSON array of objects")
+            return [_to_float(record) for record in records]
+        return [_to_float(record.get(column) if isinstance(record, dict) else None) for record in records]
+
+    if text.startswith("{"):
+        if not column:
+            raise BatchError("column is required for ndjson data")
+        values = []
+        for line_no, line in enumerate(text.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                raise BatchError(f"line {line_no} is not valid JSON")
+            values.append(_to_float(record.get(column) if isinstance(record, dict) else None))
+        return values
+
+    reader = csv.reader(io.StringIO(text))
+    header = [name.strip() for name in next(reader)]
+    if column is None:
+        index = 0
+    elif column in header:
+        index = header.index(column)
+    else:
+        raise BatchError(f"column '{column}' not found (columns: {', '.join(header)})")
+    return [_to_float(row[index]) if index < len(row) else float("nan") for row in reader]
+
+
+def load_values(values: Optional[Sequence[Optional[float]]], data: Optional[str],
+                column: Optional[str], name: str = "values", column_arg: Optional[str] = None):
+    """Return the batch as a float64 array, from ``values`` or a ``data`` column.
+
+    When ``column_arg`` is given the column must be named explicitly with
+    ``data`` (tools reading two operands from the same data shouldn't both
+    fall back to the first CSV column); it's the argument name used in errors.
+    """
+    np = _np()
+    if values is not None and data is not None:
+        raise BatchError(f"pass either {name} or data, not both")
+    if values is not None:
+        raw = [_to_float(v) for v in values]
+    elif data is not None:
+        if column_arg and not column:
+            raise BatchError(f"{column_arg} is required with data")
+        raw = _column_from_data(data, column)
+    else:
+        raise BatchError(f"pass {name} or data")
+    if not raw:
+        raise BatchError(f"{name} is empty")
+    if len(raw) > MAX_BATCH_SIZE:
+        raise BatchError(f"batch too large ({len(raw)} values, max {MAX_BATCH_SIZE})")
+    return np.asarray(raw, dtype=np.float64)
+
+
+def broadcast_pair(a, b) -> Tuple[Any, Any]:
+    """Line up two operand arrays; a single value is applied to every row."""
+    if len(a) != len(b) and 1 not in (len(a), len(b)):
+        raise BatchError(f"a has {len(a)} values but b has {len(b)}")
+    return _np().broadcast_arrays(a, b)
+
+
+Flagged = List[Tuple[Any, str]]
+
+
+def _flag(mask, reason: str, flagged: Flagged) -> None:
+    """Record the elements selected by ``mask`` as invalid for ``reason``."""
+    if mask.any():
+        flagged.append((mask, reason))
+
+
+def _flag_inputs(flagged: Flagged, **operands) -> None:
+    """Flag missing or non-numeric input elements, per operand."""
+    np = _np()
+    for name, values in operands.items():
+        _flag(~np.isfinite(values), f"Invalid {name}", flagged)
+
+
+def _flag_overflow(results, flagged: Flagged) -> None:
+    """Flag results that overflowed although their inputs were valid."""
+    np = _np()
+    overflowed = ~np.isfinite(results)
+    for mask, _ in flagged:
+        overflowed &= ~mask
+    _flag(overflowed, "Result overflowed", flagged)
+
+
+def add(a, b) -> Tuple[Any, Flagged]:
+    a, b = broadcast_pair(a, b)
+    flagged: Flagged = []
+    _flag_inputs(flagged, a=a, b=b)
+    with _np().errstate(over="ignore", invalid="ignore"):
+        results = a + b
+    _flag_overflow(results, flagged)
+    return results, flagged
+
+
+def multiply(a, b) -> Tuple[Any, Flagged]:
+    a, b = broadcast_pair(a, b)
+    flagged: Flagged = []
+    _flag_inputs(flagged, a=a, b=b)
+    with _np().errstate(over="ignore", invalid="ignore"):
+        results = a * b
+    _flag_overflow(results, flagged)
+    return results, flagged
+
+
+def square_root(values) -> Tuple[Any, Flagged]:
+    np = _np()
+    flagged: Flagged = []
+    _flag_inputs(flagged, number=values)
+    negative = values < 0
+    _flag(negative, "Cannot take the square root of a negative number", flagged)
+    return np.sqrt(np.where(negative, np.nan, values)), flagged
+
+
+_TO_CELSIUS = {
+    "C": lambda t: t,
+    "F": lambda t: (t - 32) * 5/9,
+    "K": lambda t: t - 273.15,
+}
+_FROM_CELSIUS = {
+    "C": lambda c: c,
+    "F": lambda c: c * 9/5 + 32,
+    "K": lambda c: c + 273.15,
+}
+TEMPERATURE_UNITS = tuple(_TO_CELSIUS)
+
+
+def convert_temperature(values, from_unit: str, to_unit: str) -> Tuple[Any, Flagged]:
+    """Convert between C, F and K; units must be in ``TEMPERATURE_UNITS``."""
+    flagged: Flagged = []
+    _flag_inputs(flagged, temperature=values)
+    with _np().errstate(over="ignore", invalid="ignore"):
+        celsius = _TO_CELSIUS[from_unit](values)
+        _flag(celsius < -273.15, "Below absolute zero", flagged)
+        results = _FROM_CELSIUS[to_unit](celsius)
+    _flag_overflow(results, flagged)
+    return results, flagged
+
+
+def check_page(offset: int, limit: int) -> None:
+    """Validate the slice of results a call asks for."""
+    if offset < 0:
+        raise BatchError("offset can't be negative")
+    if not 1 <= limit <= MAX_LISTED:
+        raise BatchError(f"limit must be between 1 and {MAX_LISTED}")
+
+
+def format_batch(title: str, results, flagged: Flagged, offset: int = 0, limit: int = MAX_LISTED) -> str:
+    """Render summary statistics and flagged indices for the whole batch,
+    followed by the results from ``offset`` up to ``limit`` of them.
+    """
+    np = _np()
+    invalid = np.zeros(results.shape, dtype=bool)
+    for mask, _ in flagged:
+        invalid |= mask
+    results = np.where(invalid, np.nan, results)
+    ok = results[~invalid]
+
+    lines = [title, "", f"📊 Count: {len(results)} ({len(ok)} valid, {int(invalid.sum())} flagged)"]
+    if len(ok):
+        # Valid values can still sum past the float range; report inf quietly
+        with np.errstate(over="ignore", invalid="ignore"):
+            lines += [
+                f"• Sum: {ok.sum():.6g}",
+                f"• Mean: {ok.mean():.6g}",
+                f"• Std: {ok.std():.6g}",
+                f"• Min: {ok.min():.6g}",
+                f"• Max: {ok.max():.6g}",
+            ]
+
+    for mask, reason in flagged:
+        indices = np.flatnonzero(mask)
+        shown = ", ".join(map(str, indices[:MAX_FLAGGED_LISTED]))
+        more = f" (+{len(indices) - MAX_FLAGGED_LISTED} more)" if len(indices) > MAX_FLAGGED_LISTED else ""
+        lines.append(f"⚠️ {reason}: index {shown}{more}")
+
+    shown = results[offset:offset + limit]
+    if not len(shown):
+        lines += ["", f"No results at offset {offset} (the batch has {len(results)})"]
+        return "\n".join(lines)
+    # Full precision, so results match the scalar tools exactly
+    values = ",".join("null" if math.isnan(x) else repr(x) for x in shown.tolist())
+    end = offset + len(shown)
+    page = f" {offset}-{end - 1} of {len(results)}" if offset or end < len(results) else ""
+    lines += ["", f"Results{page}:", f"[{values}]"]
+    if end < len(results):
+        lines.append(f"More results: call again with offset={end}")
+    return "\n".join(lines)
@@ -0,0 +1,206 @@
+"""Named, persistent counters for the learning MCP server.
+
+Counter values live in a dict, so reads and increments are O(1) and never
+touch the disk. Changes are collected as per-counter deltas and written to
+SQLite in one transaction every ``flush_every`` updates, ``flush_interval``
+seconds after the first unsaved update, and when the process exits.
+
+Deltas are applied with ``value = value + delta`` rather than overwriting, so
+several server processes (one per stdio client) can share the same database
+without losing each other's increments. A process sees other processes'
+updates to a counter after its own next flush of that counter.
+
+Values are kept within SQLite's signed 64-bit integer range: an update that
+would leave it raises ``CounterRangeError`` and changes nothing. That check
+only sees this process's values, so the upsert also saturates at the range
+limits when deltas from several processes add up past them (plain
+``value + delta`` would silently turn into a REAL). If a flush fails anyway,
+its deltas are put back so they go out with the next one.
+"""
+
+import asyncio
+import atexit
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple
+
+from data_dir import default_db_path
+
+# Overrides the default location (counters.db in the per-user data directory)
+DB_ENV_VAR = "LEARNING_MCP_COUNTERS_DB"
+
+# SQLite INTEGER range
+MIN_VALUE = -2**63
+MAX_VALUE = 2**63 - 1
+
+# Adds a delta on disk, saturating at the 64-bit limits instead of overflowing
+_ADD_DELTA = """
+INSERT INTO counters (name, value) VALUES (:name, :delta)
+ON CONFLICT (name) DO UPDATE SET value = CASE
+    WHEN excluded.value > 0 AND value > :max - excluded.value THEN :max
+    WHEN excluded.value < 0 AND value < :min - excluded.value THEN :min
+    ELSE value + excluded.value
+END
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class CounterRangeError(ValueError):
+    """An amount or resulting counter value doesn't fit in a 64-bit integer."""
+
+
+def check_range(value: int, what: str = "Counter value") -> None:
+    if not MIN_VALUE <= value <= MAX_VALUE:
+        raise CounterRangeError(f"{what} must be between {MIN_VALUE} and {MAX_VALUE}")
+
+
+class CounterStore:
+    """In-memory counters with write-coalesced SQLite persistence."""
+
+    def __init__(self, path: Optional[os.PathLike] = None, flush_every: int = 1000,
+                 flush_interval: float = 1.0):
+        self.path = Path(path) if path else default_db_path(DB_ENV_VAR, "counters.db")
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._conn: Optional[sqlite3.Connection] = None
+        self._values: Optional[Dict[str, int]] = None
+        # name -> (was reset, change since the last flush)
+        self._pending: Dict[str, Tuple[bool, int]] = {}
+        self._pending_updates = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._lock = threading.RLock()
+
+    @property
+    def values(self) -> Dict[str, int]:
+        """Load every counter on first use; later reads are served from memory."""
+        if self._values is None:
+            with self._lock:
+                if self._values is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    conn = sqlite3.connect(self.path, check_same_thread=False)
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("PRAGMA synchronous=NORMAL")
+                    conn.executescript(_SCHEMA)
+                    self._conn = conn
+                    self._values = {name: int(value) for name, value in
+                                    conn.execute("SELECT name, value FROM counters")}
+                    atexit.register(self.close)
+        return self._values
+
+    def get(self, name: str) -> int:
+        return self.values.get(name, 0)
+
+    def increment(self, name: str, amount: int = 1) -> int:
+        """Add ``amount`` to a counter and return its new value."""
+        values = self.values
+        with self._lock:
+            check_range(amount, "Amount")
+            reset, delta = self._pending.get(name, (False, 0))
+            value = values.get(name, 0) + amount
+            check_range(value)
+            check_range(delta + amount, "Unsaved change")
+            values[name] = value
+            self._pending[name] = (reset, delta + amount)
+            self._updated(1)
+        return value
+
+    def increment_many(self, amounts: Mapping[str, int]) -> Dict[str, int]:
+        """Apply several increments at once and return the new values."""
+        values = self.values
+        with self._lock:
+            # Check everything first so a bad amount leaves every counter unchanged
+            updates = {}
+            for name, amount in amounts.items():
+                check_range(amount, "Amount")
+                reset, delta = self._pending.get(name, (False, 0))
+                check_range(values.get(name, 0) + amount)
+                check_range(delta + amount, "Unsaved change")
+                updates[name] = (reset, delta + amount)
+            for name, amount in amounts.items():
+                values[name] = values.get(name, 0) + amount
+            self._pending.update(updates)
+            self._updated(len(amounts))
+            return {name: values[name] for name in amounts}
+
+    def reset(self, name: str) -> int:
+        """Set a counter back to 0 and return its old value."""
+        values = self.values
+        with self._lock:
+            old_value = values.get(name, 0)
+            values[name] = 0
+            self._pending[name] = (True, 0)
+            self._updated(1)
+        return old_value
+
+    def _updated(self, count: int) -> None:
+        self._pending_updates += count
+        if self._pending_updates >= self.flush_every:
+            self.flush()
+        elif self._timer is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return  # No event loop: rely on flush_every and the exit hook
+            self._timer = loop.call_later(self.flush_interval, self.flush)
+
+    def flush(self) -> None:
+        """Write pending changes to disk and pick up other processes' updates."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            updates, self._pending_updates = self._pending_updates, 0
+            try:
+                self._write(pending)
+            except BaseException:
+                self._restore(pending, updates)
+                raise
+
+    def _write(self, pending: Mapping[str, Tuple[bool, int]]) -> None:
+        """Apply pending changes in one transaction and re-read those counters."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO counters (name, value) VALUES (?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET value = excluded.value",
+                ((name, delta) for name, (reset, delta) in pending.items() if reset),
+            )
+            self._conn.executemany(
+                _ADD_DELTA,
+                ({"name": name, "delta": delta, "min": MIN_VALUE, "max": MAX_VALUE}
+                 for name, (reset, delta) in pending.items() if not reset),
+            )
+            for name in pending:
+                # Always hand out ints, whatever type another writer stored
+                self._values[name] = int(self._conn.execute(
+                    "SELECT value FROM counters WHERE name = ?", (name,)
+                ).fetchone()[0])
+
+    def _restore(self, pending: Mapping[str, Tuple[bool, int]], updates: int) -> None:
+        """Merge the deltas of a failed flush back into the pending changes."""
+        for name, (reset, delta) in pending.items():
+            newer_reset, newer_delta = self._pending.get(name, (False, 0))
+            if not newer_reset:
+                self._pending[name] = (reset, delta + newer_delta)
+        self._pending_updates += updates
+
+    def close(self) -> None:
+        """Flush and close the database."""
+        with self._lock:
+            if self._conn is None:
+                return
+            self.flush()
+            self._conn.close()
+            self._conn = None
+            self._values = None
+            atexit.unregister(self.close)
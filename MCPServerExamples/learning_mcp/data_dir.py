@@ -0,0 +1,37 @@
+"""Where the learning MCP server keeps its SQLite databases by default.
+
+Data lives in a per-user directory rather than next to the code, which may be
+a read-only checkout or site-packages once the package is installed:
+
+* ``%LOCALAPPDATA%\\learning_mcp`` on Windows;
+* ``~/Library/Application Support/learning_mcp`` on macOS;
+* ``$XDG_DATA_HOME/learning_mcp`` (usually ``~/.local/share/learning_mcp``)
+  everywhere else.
+
+Each store also honours its own environment variable (``LEARNING_MCP_NOTES_DB``,
+``LEARNING_MCP_COUNTERS_DB``). MCP hosts start stdio servers with only a few
+variables such as HOME and PATH, so those must be set in the host's ``env``
+config to reach the server.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+APP_NAME = "learning_mcp"
+
+
+def user_data_dir() -> Path:
+    """The per-user data directory for this platform (not created here)."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support"
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    return Path(base) / APP_NAME
+
+
+def default_db_path(env_var: str, filename: str) -> Path:
+    """``$env_var`` if set, otherwise ``filename`` in the user data directory."""
+    return Path(os.environ.get(env_var) or user_data_dir() / filename)
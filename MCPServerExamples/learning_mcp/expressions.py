@@ -0,0 +1,178 @@
+"""Safe arithmetic expression evaluation for the learning MCP server.
+
+Expressions are parsed with ``ast`` and checked against a whitelist: numbers,
+variables, ``+ - * / // % **``, unary ``+``/``-``, a few ``math`` constants and
+calls to a fixed set of ``math`` functions. Anything else (attribute access,
+subscripts, comprehensions, lambdas...) is rejected before evaluation.
+
+A checked expression is compiled once to a code object and kept in an LRU
+cache, so evaluating the same formula over many variable bindings only pays
+for parsing the first time.
+
+Evaluation cost is bounded: the source length and node count are capped,
+every value is a float (so there are no unbounded big-integer results), and
+``**`` goes through ``math.pow``, which raises instead of producing huge or
+complex numbers.
+"""
+
+import ast
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Mapping
+
+MAX_EXPRESSION_LENGTH = 1_000
+MAX_NODES = 200
+CACHE_SIZE = 256
+
+
+class ExpressionError(ValueError):
+    """The expression is not allowed, or can't be evaluated with these variables."""
+
+
+def _float_result(fn: Callable[..., Any]) -> Callable[..., float]:
+    return lambda *args: float(fn(*args))
+
+
+def _round(x: float, ndigits: float = 0.0) -> float:
+    """``round`` with ``ndigits`` given as a float literal, like every number here."""
+    if not (math.isfinite(ndigits) and ndigits.is_integer()):
+        raise ValueError("round() digits must be a whole number")
+    return float(round(x, int(ndigits)))
+
+
+FUNCTIONS: Dict[str, Callable[..., float]] = {
+    name: getattr(math, name)
+    for name in (
+        "sqrt", "exp", "log", "log10", "log2", "sin", "cos", "tan", "asin", "acos",
+        "atan", "atan2", "sinh", "cosh", "tanh", "fabs", "hypot", "degrees", "radians",
+    )
+}
+FUNCTIONS.update({
+    # Integer-returning helpers are wrapped so every value stays a float
+    "floor": _float_result(math.floor),
+    "ceil": _float_result(math.ceil),
+    "trunc": _float_result(math.trunc),
+    "round": _round,
+    "abs": _float_result(abs),
+    "min": _float_result(min),
+    "max": _float_result(max),
+    "pow": math.pow,
+})
+
+CONSTANTS: Dict[str, float] = {"pi": math.pi, "e": math.e, "tau": math.tau, "inf": math.inf}
+
+# Names that always mean a constant or function, never a variable
+_RESERVED = frozenset(CONSTANTS) | frozenset(FUNCTIONS)
+
+_BINARY_OPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)
+_UNARY_OPS = (ast.UAdd, ast.USub)
+
+
+@dataclass(frozen=True)
+class CompiledExpression:
+    """A checked expression, compiled and ready to evaluate."""
+
+    source: str
+    code: Any
+    variables: FrozenSet[str]
+
+    def evaluate(self, variables: Mapping[str, float]) -> float:
+        """Evaluate with the given variable values."""
+        reserved = variables.keys() & _RESERVED
+        if reserved:
+            raise ExpressionError(f"Variable name(s) clash with built-in constants or functions: "
+                                  f"{', '.join(sorted(reserved))}")
+        missing = self.variables - variables.keys()
+        if missing:
+            raise ExpressionError(f"Missing value for variable(s): {', '.join(sorted(missing))}")
+        namespace: Dict[str, Any] = {name: float(variables[name]) for name in self.variables}
+        namespace.update(CONSTANTS)
+        namespace.update(FUNCTIONS)
+        namespace["__builtins__"] = {}
+        try:
+            return float(eval(self.code, namespace))
+        except ZeroDivisionError:
+            raise ExpressionError("Division by zero")
+        except OverflowError:
+            raise ExpressionError("Result is too large")
+        except (ValueError, TypeError) as e:
+            raise ExpressionError(f"Math error: {e}")
+
+
+class _Checker(ast.NodeTransformer):
+    """Reject non-whitelisted syntax, float-ify literals and route ``**`` through pow."""
+
+    def __init__(self) -> None:
+        self.variables = set()
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        raise ExpressionError(f"'{type(node).__name__}' is not allowed in expressions")
+
+    def visit_Expression(self, node: ast.Expression) -> ast.AST:
+        node.body = self.visit(node.body)
+        return node
+
+    def visit_Constant(self, node: ast.Constant) -> ast.AST:
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ExpressionError(f"Only numbers are allowed, not {node.value!r}")
+        try:
+            value = float(node.value)
+        except OverflowError:
+            raise ExpressionError("Number is too large")
+        return ast.copy_location(ast.Constant(value), node)
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if node.id in FUNCTIONS:
+            raise ExpressionError(f"'{node.id}' is a function; call it like {node.id}(x)")
+        if node.id not in CONSTANTS:
+            if node.id.startswith("_"):
+                raise ExpressionError(f"Invalid variable name '{node.id}'")
+            self.variables.add(node.id)
+        return node
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        if not isinstance(node.op, _UNARY_OPS):
+            raise ExpressionError(f"Operator '{type(node.op).__name__}' is not allowed")
+        node.operand = self.visit(node.operand)
+        return node
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        if not isinstance(node.op, _BINARY_OPS):
+            raise ExpressionError(f"Operator '{type(node.op).__name__}' is not allowed")
+        node.left = self.visit(node.left)
+        node.right = self.visit(node.right)
+        if isinstance(node.op, ast.Pow):
+            call = ast.Call(func=ast.Name("pow", ast.Load()), args=[node.left, node.right], keywords=[])
+            return ast.copy_location(call, node)
+        return node
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+            name = node.func.id if isinstance(node.func, ast.Name) else ast.unparse(node.func)
+            raise ExpressionError(f"Unknown function '{name}'. Available: {', '.join(sorted(FUNCTIONS))}")
+        if node.keywords:
+            raise ExpressionError("Keyword arguments are not allowed")
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(source: str) -> CompiledExpression:
+    """Check and compile an expression, reusing the result for repeated sources."""
+    if len(source) > MAX_EXPRESSION_LENGTH:
+        raise ExpressionError(f"Expression is too long (max {MAX_EXPRESSION_LENGTH} characters)")
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ExpressionError(f"Invalid syntax: {e.msg}")
+    except (MemoryError, RecursionError):
+        raise ExpressionError("Expression is nested too deeply")
+    node_count = sum(1 for _ in ast.walk(tree))
+    if node_count > MAX_NODES:
+        raise ExpressionError(f"Expression is too complex ({node_count} nodes, max {MAX_NODES})")
+
+    checker = _Checker()
+    tree = ast.fix_missing_locations(checker.visit(tree))
+    code = compile(tree, "<expression>", "eval")
+    return CompiledExpression(source, code, frozenset(checker.variables))
@@ -1,15 +1,38 @@
-from typing import Any
+import sys
+import asyncio
 from mcp.server.fastmcp import FastMCP
-import json
 from datetime import datetime
 import math
+from pathlib import Path
+from typing import Optional
+
+import batch_math
+from batch_math import BatchError
+from expressions import ExpressionError, compile_expression
+from counters_store import MAX_VALUE, MIN_VALUE, CounterRangeError, CounterStore
+from notes_store import NotesStore
+import passwords
+from text_stats import TextStats, analyze_chunks, iter_file, iter_text
 
 # Initialize FastMCP server
 mcp = FastMCP("learning-basics")
 
-# Simple in-memory data storage for learning
-NOTES = []
-COUNTER = 0
+# Notes and counters persist in SQLite (see notes_store.py and counters_store.py)
+NOTES = NotesStore()
+COUNTERS = CounterStore()
+
+# Most coins / dice / passwords produced by one call
+MAX_RANDOM_COUNT = 10_000
+MAX_PASSWORD_COUNT = 1_000
+
+# Counter used when a counter tool is called without a name
+DEFAULT_COUNTER = "default"
+
+# Longest text count_characters echoes back in full; longer inputs get a preview
+ECHO_LIMIT = 500
+
+# Most variable bindings evaluate_expression accepts in one call
+MAX_BINDINGS = 10_000
 
 @mcp.tool()
 async def say_hello(name: str = "World") -> str:
@@ -55,6 +78,164 @@ async def calculate_square_root(number: float) -> str:
     result = math.sqrt(number)
     return f"√{number} = {result:.2f}"
 
+@mcp.tool()
+async def add_numbers_batch(a: Optional[list[Optional[float]]] = None, b: Optional[list[Optional[float]]] = None,
+                            data: Optional[str] = None, a_column: Optional[str] = None,
+                            b_column: Optional[str] = None, offset: int = 0,
+                            limit: int = batch_math.MAX_LISTED) -> str:
+    """Add many pairs of numbers in one call.
+    
+    Pass the operands as arrays (a, b), or as two columns of inline CSV/ndjson
+    (data, a_column, b_column). A single value for a or b is added to every row.
+    
+    Args:
+        a: First numbers
+        b: Second numbers
+        data: Inline CSV (with a header row), ndjson or a JSON array to read the columns from
+        a_column: Column holding the first numbers (required with data)
+        b_column: Column holding the second numbers (required with data)
+        offset: Index of the first result to return (for paging through large batches)
+        limit: How many results to return (max 10000)
+    """
+    try:
+        batch_math.check_page(offset, limit)
+        a_values = batch_math.load_values(a, data, a_column, "a", "a_column")
+        b_values = batch_math.load_values(b, data, b_column, "b", "b_column")
+        results, flagged = batch_math.add(a_values, b_values)
+    except BatchError as e:
+        return f"Error: {e}"
+    
+    return batch_math.format_batch("➕ Batch addition", results, flagged, offset, limit)
+
+@mcp.tool()
+async def multiply_numbers_batch(a: Optional[list[Optional[float]]] = None, b: Optional[list[Optional[float]]] = None,
+                                 data: Optional[str] = None, a_column: Optional[str] = None,
+                                 b_column: Optional[str] = None, offset: int = 0,
+                                 limit: int = batch_math.MAX_LISTED) -> str:
+    """Multiply many pairs of numbers in one call.
+    
+    Pass the operands as arrays (a, b), or as two columns of inline CSV/ndjson
+    (data, a_column, b_column). A single value for a or b multiplies every row.
+    
+    Args:
+        a: First numbers
+        b: Second numbers
+        data: Inline CSV (with a header row), ndjson or a JSON array to read the columns from
+        a_column: Column holding the first numbers (required with data)
+        b_column: Column holding the second numbers (required with data)
+        offset: Index of the first result to return (for paging through large batches)
+        limit: How many results to return (max 10000)
+    """
+    try:
+        batch_math.check_page(offset, limit)
+        a_values = batch_math.load_values(a, data, a_column, "a", "a_column")
+        b_values = batch_math.load_values(b, data, b_column, "b", "b_column")
+        results, flagged = batch_math.multiply(a_values, b_values)
+    except BatchError as e:
+        return f"Error: {e}"
+    
+    return batch_math.format_batch("✖️ Batch multiplication", results, flagged, offset, limit)
+
+@mcp.tool()
+async def calculate_square_root_batch(numbers: Optional[list[Optional[float]]] = None, data: Optional[str] = None,
+                                      column: Optional[str] = None, offset: int = 0,
+                                      limit: int = batch_math.MAX_LISTED) -> str:
+    """Calculate the square roots of many numbers in one call.
+    
+    Negative numbers are flagged by index instead of failing the whole batch.
+    
+    Args:
+        numbers: The numbers to find the square roots of
+        data: Inline CSV (with a header row), ndjson or a JSON array to read the numbers from
+        column: Column holding the numbers (with data; CSV defaults to the first column)
+        offset: Index of the first result to return (for paging through large batches)
+        limit: How many results to return (max 10000)
+    """
+    try:
+        batch_math.check_page(offset, limit)
+        values = batch_math.load_values(numbers, data, column, "numbers")
+    except BatchError as e:
+        return f"Error: {e}"
+    
+    results, flagged = batch_math.square_root(values)
+    return batch_math.format_batch("√ Batch square roots", results, flagged, offset, limit)
+
+@mcp.tool()
+async def convert_temperature_batch(from_unit: str, to_unit: str,
+                                    temperatures: Optional[list[Optional[float]]] = None,
+                                    data: Optional[str] = None, column: Optional[str] = None,
+                                    offset: int = 0, limit: int = batch_math.MAX_LISTED) -> str:
+    """Convert many temperatures between Celsius, Fahrenheit, and Kelvin in one call.
+    
+    Values below absolute zero are flagged by index instead of failing the whole batch.
+    
+    Args:
+        from_unit: Source unit (C, F, or K)
+        to_unit: Target unit (C, F, or K)
+        temperatures: The temperature values to convert
+        data: Inline CSV (with a header row), ndjson or a JSON array to read the values from
+        column: Column holding the values (with data; CSV defaults to the first column)
+        offset: Index of the first result to return (for paging through large batches)
+        limit: How many results to return (max 10000)
+    """
+    from_unit = from_unit.upper()
+    to_unit = to_unit.upper()
+    if from_unit not in batch_math.TEMPERATURE_UNITS or to_unit not in batch_math.TEMPERATURE_UNITS:
+        return "Error: Use C (Celsius), F (Fahrenheit), or K (Kelvin)"
+    
+    try:
+        batch_math.check_page(offset, limit)
+        values = batch_math.load_values(temperatures, data, column, "temperatures")
+    except BatchError as e:
+        return f"Error: {e}"
+    
+    results, flagged = batch_math.convert_temperature(values, from_unit, to_unit)
+    return batch_math.format_batch(f"🌡️ Batch conversion °{from_unit} → °{to_unit}", results, flagged, offset, limit)
+
+@mcp.tool()
+async def evaluate_expression(expression: str, variables: Optional[dict[str, float]] = None,
+                              bindings: Optional[list[dict[str, float]]] = None) -> str:
+    """Evaluate a math formula in one call, e.g. "sqrt(x**2 + y**2) * 2".
+    
+    Supports + - * / // % **, parentheses, variables, the constants pi, e, tau, inf
+    and math functions such as sqrt, log, sin, cos, floor, min, max.
+    
+    Args:
+        expression: The formula to evaluate
+        variables: Values for the variables in the formula, e.g. {"x": 3, "y": 4}
+        bindings: Evaluate the formula once per set of variable values (optional)
+    """
+    try:
+        compiled = compile_expression(expression)
+    except ExpressionError as e:
+        return f"Error: {e}"
+    
+    if bindings is None:
+        try:
+            result = compiled.evaluate(variables or {})
+        except ExpressionError as e:
+            return f"Error: {e}"
+        return f"🧮 {expression} = {result:.10g}"
+    
+    if len(bindings) > MAX_BINDINGS:
+        return f"Error: Too many bindings ({len(bindings)}, max {MAX_BINDINGS})"
+    
+    results = []
+    errors = []
+    for index, binding in enumerate(bindings):
+        try:
+            results.append(f"{compiled.evaluate({**(variables or {}), **binding}):.10g}")
+        except ExpressionError as e:
+            results.append("null")
+            errors.append(f"⚠️ #{index}: {e}")
+    
+    lines = [f"🧮 {expression} over {len(bindings)} bindings ({len(bindings) - len(errors)} ok, {len(errors)} failed)"]
+    lines += errors[:20]
+    if len(errors) > 20:
+        lines.append(f"⚠️ ...and {len(errors) - 20} more errors")
+    lines += ["", "Results:", f"[{','.join(results)}]"]
+    return "\n".join(lines)
+
 @mcp.tool()
 async def get_current_time() -> str:
     """Get the current date and time."""
@@ -70,38 +251,112 @@ async def count_characters(text: str) -> str:
     Args:
         text: The text to analyze
     """
-    char_count = len(text)
-    word_count = len(text.split())
-    line_count = len(text.split('\n'))
+    stats = analyze_chunks(iter_text(text))
+    
+    if len(text) <= ECHO_LIMIT:
+        echo = f'Text: "{text}" '
+    else:
+        echo = f'Text (first {ECHO_LIMIT} of {len(text)} characters): "{text[:ECHO_LIMIT]}…" '
     
     return f"""Text Analysis:
-📝 Characters: {char_count}
-📖 Words: {word_count}
-📄 Lines: {line_count}
+📝 Characters: {stats.chars}
+📖 Words: {stats.words}
+📄 Lines: {stats.lines}
+
+{echo}"""
 
-Text: "{text}" """
+def _format_file_stats(path: Path, stats: TextStats, byte_stats: bool) -> str:
+    """Render the result of analyze_text_file."""
+    lines = [
+        f"File Analysis: {path}",
+        f"📝 Characters: {stats.chars}",
+        f"📖 Words: {stats.words}",
+        f"📄 Lines: {stats.lines}",
+    ]
+    if byte_stats:
+        lines += [
+            "",
+            "💾 Bytes:",
+            f"• Size on disk: {path.stat().st_size}",
+            f"• UTF-8 bytes decoded: {stats.utf8_bytes}",
+            f"• Non-ASCII characters: {stats.non_ascii}",
+            f"• Invalid UTF-8 sequences (replaced with �): {stats.replacement_chars}",
+        ]
+    top_words = stats.top_words()
+    if top_words:
+        lines += ["", f"🏆 Top {len(top_words)} words:"]
+        lines += [f"{rank}. {word} ({count})" for rank, (word, count) in enumerate(top_words, 1)]
+    return "\n".join(lines)
 
 @mcp.tool()
-async def flip_coin() -> str:
-    """Flip a coin and get heads or tails."""
-    import random
-    result = random.choice(["Heads", "Tails"])
-    coin_emoji = "🪙" if result == "Heads" else "🎯"
-    return f"Coin flip result: {result} {coin_emoji}"
+async def analyze_text_file(path: str, top_k: int = 0, byte_stats: bool = False) -> str:
+    """Count characters, words, and lines in a local UTF-8 text file.
+    
+    The file is read in chunks, so large files don't need to fit in memory.
+    
+    Args:
+        path: Path to the text file
+        top_k: Also list this many most frequent words (default: 0, max: 100)
+        byte_stats: Also report byte size and UTF-8 details (default: False)
+    """
+    file_path = Path(path).expanduser()
+    if not file_path.is_file():
+        return f"Error: File not found: {path}"
+    if top_k < 0 or top_k > 100:
+        return "Error: top_k must be between 0 and 100!"
+    
+    def analyze() -> TextStats:
+        return analyze_chunks(iter_file(file_path), top_k, byte_stats)
+    
+    try:
+        # Read in a worker thread so a big file doesn't stall other requests
+        stats = await asyncio.to_thread(analyze)
+    except OSError as e:
+        return f"Error: Could not read {path}: {e.strerror}"
+    
+    return _format_file_stats(file_path, stats, byte_stats)
+
+@mcp.tool()
+async def flip_coin(count: int = 1) -> str:
+    """Flip one or more coins and get heads or tails.
+    
+    Args:
+        count: Number of coins to flip (default: 1, max: 10000)
+    """
+    if count < 1 or count > MAX_RANDOM_COUNT:
+        return f"Error: You can flip between 1 and {MAX_RANDOM_COUNT} coins!"
+    
+    flips = passwords.random_below(2, count)
+    if count == 1:
+        result = "Heads" if flips[0] == 0 else "Tails"
+        coin_emoji = "🪙" if result == "Heads" else "🎯"
+        return f"Coin flip result: {result} {coin_emoji}"
+    
+    heads = count - sum(flips)
+    sequence = "".join("T" if flip else "H" for flip in flips)
+    return f"""🪙 Flipped {count} coins: {heads} Heads, {count - heads} Tails
+Results (H/T): {sequence}"""
 
 @mcp.tool()
-async def roll_dice(sides: int = 6) -> str:
-    """Roll a dice with specified number of sides.
+async def roll_dice(sides: int = 6, count: int = 1) -> str:
+    """Roll one or more dice with specified number of sides.
     
     Args:
         sides: Number of sides on the dice (default: 6)
+        count: Number of dice to roll (default: 1, max: 10000)
     """
-    import random
     if sides < 2:
         return "Error: Dice must have at least 2 sides!"
+    if count < 1 or count > MAX_RANDOM_COUNT:
+        return f"Error: You can roll between 1 and {MAX_RANDOM_COUNT} dice!"
     
-    result = random.randint(1, sides)
-    return f"🎲 Rolled a {sides}-sided dice: {result}"
+    rolls = [roll + 1 for roll in passwords.random_below(sides, count)]
+    if count == 1:
+        return f"🎲 Rolled a {sides}-sided dice: {rolls[0]}"
+    
+    total = sum(rolls)
+    return f"""🎲 Rolled {count} {sides}-sided dice: total {total}, average {total / count:.2f}, min {min(rolls)}, max {max(rolls)}
+Results: {', '.join(map(str, rolls))}"""
 
 @mcp.tool()
 async def add_note(note: str) -> str:
@@ -110,55 +365,164 @@ async def add_note(note: str) -> str:
     Args:
         note: The note text to save
     """
-    global NOTES
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-    note_entry = {
-        "id": len(NOTES) + 1,
-        "text": note,
-        "timestamp": timestamp
-    }
-    NOTES.append(note_entry)
+    note_entry = NOTES.add(note)
     return f"✅ Note saved! (ID: {note_entry['id']}) - {note}"
 
+def _format_notes(title: str, notes: list, next_cursor: Optional[int]) -> str:
+    """Render one page of notes, with a hint for fetching the next page."""
+    lines = [title, ""]
+    for note in notes:
+        lines.append(f"#{note['id']} - {note['timestamp']}\n{note['text']}\n")
+    if next_cursor is not None:
+        lines.append(f"➡️ More notes available. Use cursor={next_cursor} to see the next page.")
+    return "\n".join(lines).strip()
+
 @mcp.tool()
-async def list_notes() -> str:
-    """List all your saved notes."""
-    if not NOTES:
+async def list_notes(cursor: int = 0, limit: int = 20) -> str:
+    """List your saved notes, oldest first, one page at a time.
+    
+    Args:
+        cursor: Show notes after this note ID (default: 0, the first page)
+        limit: Maximum number of notes to show (default: 20, max: 100)
+    """
+    notes, next_cursor = NOTES.list(cursor, limit)
+    if not notes:
+        if cursor:
+            return f"📝 No notes after #{cursor}."
         return "📝 No notes saved yet. Use 'add_note' to create your first note!"
     
-    notes_list = "📋 Your Notes:\n\n"
-    for note in NOTES:
-        notes_list += f"#{note['id']} - {note['timestamp']}\n{note['text']}\n\n"
+    return _format_notes("📋 Your Notes:", notes, next_cursor)
+
+@mcp.tool()
+async def search_notes(query: str, cursor: int = 0, limit: int = 20) -> str:
+    """Find notes that contain every word in the query.
+    
+    Args:
+        query: Words to look for (case-insensitive)
+        cursor: Show matches after this note ID (default: 0, the first page)
+        limit: Maximum number of notes to show (default: 20, max: 100)
+    """
+    notes, next_cursor = NOTES.search(query, cursor, limit)
+    if not notes:
+        return f"🔍 No notes found matching '{query}'."
+    
+    return _format_notes(f"🔍 Notes matching '{query}':", notes, next_cursor)
+
+@mcp.tool()
+async def delete_note(note_id: int) -> str:
+    """Delete a single note by its ID.
     
-    return notes_list.strip()
+    Args:
+        note_id: The ID of the note to delete
+    """
+    note = NOTES.delete(note_id)
+    if note is None:
+        return f"Error: Note #{note_id} not found!"
+    return f"🗑️ Deleted note #{note_id} - {note['text']}"
 
 @mcp.tool()
 async def clear_notes() -> str:
     """Clear all saved notes."""
-    global NOTES
-    count = len(NOTES)
-    NOTES.clear()
+    count = NOTES.clear()
     return f"🗑️ Cleared {count} notes. Your note collection is now empty."
 
+def _counter_label(name: str) -> str:
+    """How a counter is named in replies; the default counter stays unnamed."""
+    return "Counter" if name == DEFAULT_COUNTER else f"Counter '{name}'"
+
+def _check_counter_name(name: str) -> Optional[str]:
+    """Return an error message if the counter name is unusable."""
+    if not name or len(name) > 100:
+        return "Error: Counter name must be 1 to 100 characters long!"
+    return None
+
+def _check_counter_amount(amount: int) -> Optional[str]:
+    """Return an error message if the amount doesn't fit in a 64-bit counter."""
+    if not MIN_VALUE <= amount <= MAX_VALUE:
+        return f"Error: Amount must be between {MIN_VALUE} and {MAX_VALUE}!"
+    return None
+
+@mcp.tool()
+async def increment_counter(name: str = DEFAULT_COUNTER) -> str:
+    """Increment a counter by 1.
+    
+    Args:
+        name: Which counter to increment (optional, defaults to "default")
+    """
+    if error := _check_counter_name(name):
+        return error
+    try:
+        value = COUNTERS.increment(name)
+    except CounterRangeError as e:
+        return f"Error: {e}"
+    return f"🔢 {_counter_label(name)} incremented! Current value: {value}"
+
+@mcp.tool()
+async def increment_counter_by(amount: int, name: str = DEFAULT_COUNTER) -> str:
+    """Add any amount (including negative amounts) to a counter.
+    
+    Args:
+        amount: How much to add
+        name: Which counter to change (optional, defaults to "default")
+    """
+    if error := _check_counter_name(name) or _check_counter_amount(amount):
+        return error
+    try:
+        value = COUNTERS.increment(name, amount)
+    except CounterRangeError as e:
+        return f"Error: {e}"
+    return f"🔢 {_counter_label(name)} changed by {amount}! Current value: {value}"
+
+@mcp.tool()
+async def increment_counters(amounts: dict[str, int]) -> str:
+    """Increment several counters in one call.
+    
+    Args:
+        amounts: How much to add to each counter, e.g. {"visits": 1, "errors": 2}
+    """
+    if not amounts:
+        return "Error: Give at least one counter to increment!"
+    for name, amount in amounts.items():
+        if error := _check_counter_name(name) or _check_counter_amount(amount):
+            return error
+    try:
+        values = COUNTERS.increment_many(amounts)
+    except CounterRangeError as e:
+        return f"Error: {e}"
+    lines = [f"• {name}: {value}" for name, value in values.items()]
+    return "🔢 Counters incremented! Current values:\n" + "\n".join(lines)
+
 @mcp.tool()
-async def increment_counter() -> str:
-    """Increment a simple counter by 1."""
-    global COUNTER
-    COUNTER += 1
-    return f"🔢 Counter incremented! Current value: {COUNTER}"
+async def get_counter(name: str = DEFAULT_COUNTER) -> str:
+    """Get the current value of a counter.
+    
+    Args:
+        name: Which counter to read (optional, defaults to "default")
+    """
+    value = COUNTERS.get(name)
+    if name == DEFAULT_COUNTER:
+        return f"🔢 Current counter value: {value}"
+    return f"🔢 Current value of counter '{name}': {value}"
 
 @mcp.tool()
-async def get_counter() -> str:
-    """Get the current counter value."""
-    return f"🔢 Current counter value: {COUNTER}"
+async def list_counters() -> str:
+    """List every counter and its value."""
+    if not COUNTERS.values:
+        return "🔢 No counters yet. Use 'increment_counter' to start one!"
+    lines = [f"• {name}: {value}" for name, value in sorted(COUNTERS.values.items())]
+    return "🔢 Counters:\n" + "\n".join(lines)
 
 @mcp.tool()
-async def reset_counter() -> str:
-    """Reset the counter to 0."""
-    global COUNTER
-    old_value = COUNTER
-    COUNTER = 0
-    return f"🔄 Counter reset! Changed from {old_value} to 0"
+async def reset_counter(name: str = DEFAULT_COUNTER) -> str:
+    """Reset a counter to 0.
+    
+    Args:
+        name: Which counter to reset (optional, defaults to "default")
+    """
+    if error := _check_counter_name(name):
+        return error
+    old_value = COUNTERS.reset(name)
+    return f"🔄 {_counter_label(name)} reset! Changed from {old_value} to 0"
 
 @mcp.tool()
 async def generate_password(length: int = 12) -> str:
@@ -167,20 +531,45 @@ async def generate_password(length: int = 12) -> str:
     Args:
         length: Length of the password (default: 12, min: 4, max: 50)
     """
-    import random
-    import string
-    
     if length < 4:
         return "Error: Password must be at least 4 characters long!"
     if length > 50:
         return "Error: Password cannot be longer than 50 characters!"
     
     # Use letters, digits, and some safe special characters
-    characters = string.ascii_letters + string.digits + "!@#$%^&*"
-    password = ''.join(random.choice(characters) for _ in range(length))
+    classes = passwords.build_policy()
+    password = passwords.generate_passwords(1, length, classes, require_each_class=False)[0]
     
     return f"🔐 Generated password ({length} characters): {password}"
 
+@mcp.tool()
+async def generate_passwords(count: int = 10, length: int = 16, lowercase: bool = True,
+                             uppercase: bool = True, digits: bool = True, symbols: bool = True,
+                             require_each_class: bool = True, exclude_ambiguous: bool = False) -> str:
+    """Generate many secure random passwords in one call.
+    
+    Args:
+        count: Number of passwords (default: 10, max: 1000)
+        length: Length of each password (default: 16, min: 4, max: 256)
+        lowercase: Include lowercase letters (default: True)
+        uppercase: Include uppercase letters (default: True)
+        digits: Include digits (default: True)
+        symbols: Include the symbols !@#$%^&* (default: True)
+        require_each_class: Every password contains at least one character from each included class (default: True)
+        exclude_ambiguous: Leave out look-alike characters such as I, l, 1, O, 0, o (default: False)
+    """
+    if count < 1 or count > MAX_PASSWORD_COUNT:
+        return f"Error: You can generate between 1 and {MAX_PASSWORD_COUNT} passwords at a time!"
+    if length < 4 or length > 256:
+        return "Error: Password length must be between 4 and 256 characters!"
+    
+    classes = passwords.build_policy(lowercase, uppercase, digits, symbols, exclude_ambiguous)
+    if not classes:
+        return "Error: Turn on at least one character class!"
+    
+    generated = passwords.generate_passwords(count, length, classes, require_each_class)
+    return f"🔐 Generated {count} passwords ({length} characters each):\n" + "\n".join(generated)
+
 @mcp.tool()
 async def convert_temperature(temperature: float, from_unit: str, to_unit: str) -> str:
     """Convert temperature between Celsius, Fahrenheit, and Kelvin.
@@ -230,27 +619,38 @@ async def get_help() -> str:
 • add_numbers(a, b) - Add two numbers
 • multiply_numbers(a, b) - Multiply two numbers  
 • calculate_square_root(number) - Find square root
+• add_numbers_batch / multiply_numbers_batch(a, b) - Many pairs at once
+• calculate_square_root_batch(numbers) - Many square roots at once
+• evaluate_expression(expression, variables, bindings) - Evaluate a whole formula
 
 📝 Text Tools:
 • count_characters(text) - Analyze text
+• analyze_text_file(path, top_k, byte_stats) - Analyze a text file
 
 📋 Note Management:
 • add_note(note) - Save a note
-• list_notes() - Show all notes
+• list_notes(cursor, limit) - Show notes, a page at a time
+• search_notes(query, cursor, limit) - Find notes by words
+• delete_note(note_id) - Delete one note
 • clear_notes() - Delete all notes
 
-🔢 Counter:
-• increment_counter() - Add 1 to counter
-• get_counter() - Show counter value
-• reset_counter() - Reset to 0
+🔢 Counters:
+• increment_counter(name) - Add 1 to a counter
+• increment_counter_by(amount, name) - Add any amount
+• increment_counters(amounts) - Change several counters at once
+• get_counter(name) - Show a counter's value
+• list_counters() - Show all counters
+• reset_counter(name) - Reset to 0
 
 🎲 Fun Tools:
-• flip_coin() - Flip a coin
-• roll_dice(sides) - Roll dice
+• flip_coin(count) - Flip one or more coins
+• roll_dice(sides, count) - Roll one or more dice
 • generate_password(length) - Create password
+• generate_passwords(count, length, ...) - Create many passwords
 
 🌡️ Utilities:
 • convert_temperature(temp, from, to) - Convert temperature units
+• convert_temperature_batch(from, to, temperatures) - Convert many at once
 
 This is a beginner-friendly MCP server to learn the basics! 🚀
 """
@@ -258,6 +658,6 @@ This is a beginner-friendly MCP server to learn the basics! 🚀
 
 if __name__ == "__main__":
     # Initialize and run the server
-    print("Starting Learning MCP server... 🎓")
-    print("This server has basic tools perfect for beginners!")
+    print("Starting Learning MCP server... 🎓", file=sys.stderr)
+    print("This server has basic tools perfect for beginners!", file=sys.stderr)
     mcp.run(transport='stdio')
@@ -1,12 +1,25 @@
 #!/usr/bin/env python3
 
+import argparse
+import sys
 from learning_mcp import mcp
 
 def main():
     """Main entry point for the learning MCP server."""
-    print("Starting Learning MCP server... 🎓")
-    print("Perfect for beginners to learn MCP concepts!")
-    mcp.run(transport='stdio')
+    parser = argparse.ArgumentParser(description="Run the Learning MCP server.")
+    parser.add_argument("--transport", choices=["stdio", "streamable-http", "sse"], default="stdio",
+                        help="how clients connect (default: stdio, as MCP hosts expect)")
+    parser.add_argument("--port", type=int, default=8000,
+                        help="port on 127.0.0.1 for the network transports (default: 8000)")
+    args = parser.parse_args()
+
+    print("Starting Learning MCP server... 🎓", file=sys.stderr)
+    print("Perfect for beginners to learn MCP concepts!", file=sys.stderr)
+    if args.transport != "stdio":
+        mcp.settings.port = args.port
+        path = mcp.settings.streamable_http_path if args.transport == "streamable-http" else mcp.settings.sse_path
+        print(f"Listening on http://{mcp.settings.host}:{args.port}{path}", file=sys.stderr)
+    mcp.run(transport=args.transport)
 
 if __name__ == "__main__":
     main()
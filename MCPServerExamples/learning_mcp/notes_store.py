@@ -0,0 +1,184 @@
+"""SQLite-backed note storage for the learning MCP server.
+
+Notes live in a small SQLite database so they survive restarts (see
+``data_dir`` for where it is kept). IDs come from an AUTOINCREMENT column, so
+they are never reused after a note is deleted. Every query walks an index from
+a cursor, which keeps the cost of a call the same whether there are ten notes
+or a million:
+
+* ``notes`` holds the notes themselves, keyed by ID;
+* ``note_terms`` is an inverted index of (term, note_id) postings used by
+  ``search``;
+* ``terms`` keeps each term's document count, so ``search`` can walk the
+  rarest term's postings and answer queries with an unknown term at once.
+"""
+
+import os
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from data_dir import default_db_path
+
+# Overrides the default location (notes.db in the per-user data directory)
+DB_ENV_VAR = "LEARNING_MCP_NOTES_DB"
+
+# Upper bound for page sizes so a single call can't dump the whole store
+MAX_PAGE_SIZE = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    text TEXT NOT NULL,
+    timestamp TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS note_terms (
+    term TEXT NOT NULL,
+    note_id INTEGER NOT NULL,
+    PRIMARY KEY (term, note_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS note_terms_by_note ON note_terms (note_id);
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT PRIMARY KEY,
+    df INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+_TERM_RE = re.compile(r"\w+")
+
+Note = Dict[str, Any]
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into unique lowercase search terms, keeping first-seen order."""
+    return list(dict.fromkeys(_TERM_RE.findall(text.lower())))
+
+
+class NotesStore:
+    """Persistent notes with stable IDs, cursor pagination and term search."""
+
+    def __init__(self, path: Optional[os.PathLike] = None):
+        self.path = Path(path) if path else default_db_path(DB_ENV_VAR, "notes.db")
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Open the database on first use so importing the server stays cheap."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _insert(self, text: str, timestamp: str) -> int:
+        note_id = self.conn.execute(
+            "INSERT INTO notes (text, timestamp) VALUES (?, ?)", (text, timestamp)
+        ).lastrowid
+        terms = tokenize(text)
+        self.conn.executemany(
+            "INSERT INTO note_terms (term, note_id) VALUES (?, ?)",
+            ((term, note_id) for term in terms),
+        )
+        self.conn.executemany(
+            "INSERT INTO terms (term, df) VALUES (?, 1) "
+            "ON CONFLICT (term) DO UPDATE SET df = df + 1",
+            ((term,) for term in terms),
+        )
+        return note_id
+
+    def add(self, text: str) -> Note:
+        """Save a note and return it with its new ID."""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+        with self.conn:
+            note_id = self._insert(text, timestamp)
+        return {"id": note_id, "text": text, "timestamp": timestamp}
+
+    def add_many(self, texts: Iterable[str]) -> int:
+        """Save many notes in one transaction and return how many were added."""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+        count = 0
+        with self.conn:
+            for text in texts:
+                self._insert(text, timestamp)
+                count += 1
+        return count
+
+    @staticmethod
+    def _page(rows: List[sqlite3.Row], limit: int) -> Tuple[List[Note], Optional[int]]:
+        notes = [dict(row) for row in rows[:limit]]
+        next_cursor = notes[-1]["id"] if len(rows) > limit else None
+        return notes, next_cursor
+
+    def list(self, cursor: int = 0, limit: int = 20) -> Tuple[List[Note], Optional[int]]:
+        """Return up to ``limit`` notes with an ID above ``cursor``, oldest first.
+
+        The second item is the cursor for the next page, or None on the last page.
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        rows = self.conn.execute(
+            "SELECT id, text, timestamp FROM notes WHERE id > ? ORDER BY id LIMIT ?",
+            (cursor, limit + 1),
+        ).fetchall()
+        return self._page(rows, limit)
+
+    def search(self, query: str, cursor: int = 0, limit: int = 20) -> Tuple[List[Note], Optional[int]]:
+        """Return notes containing every term in ``query``, paginated like ``list``."""
+        terms = tokenize(query)
+        if not terms:
+            return [], None
+        placeholders = ", ".join("?" * len(terms))
+        counts = dict(self.conn.execute(
+            f"SELECT term, df FROM terms WHERE term IN ({placeholders})", terms
+        ).fetchall())
+        if len(counts) < len(terms) or min(counts.values()) <= 0:
+            return [], None
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        # Walk the rarest term's postings in ID order and probe the others, so
+        # the scan is bounded by the shortest posting list and SQLite stops as
+        # soon as a page is full instead of intersecting everything.
+        terms.sort(key=counts.__getitem__)
+        extra = "".join(
+            " AND EXISTS (SELECT 1 FROM note_terms o WHERE o.term = ? AND o.note_id = t.note_id)"
+            for _ in terms[1:]
+        )
+        rows = self.conn.execute(
+            "SELECT n.id, n.text, n.timestamp FROM note_terms t JOIN notes n ON n.id = t.note_id"
+            f" WHERE t.term = ? AND t.note_id > ?{extra} ORDER BY t.note_id LIMIT ?",
+            (terms[0], cursor, *terms[1:], limit + 1),
+        ).fetchall()
+        return self._page(rows, limit)
+
+    def delete(self, note_id: int) -> Optional[Note]:
+        """Delete a note, returning it, or None if no note has that ID."""
+        with self.conn:
+            row = self.conn.execute(
+                "SELECT id, text, timestamp FROM notes WHERE id = ?", (note_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            terms = self.conn.execute(
+                "SELECT term FROM note_terms WHERE note_id = ?", (note_id,)
+            ).fetchall()
+            self.conn.executemany("UPDATE terms SET df = df - 1 WHERE term = ?", terms)
+            self.conn.executemany("DELETE FROM terms WHERE term = ? AND df <= 0", terms)
+            self.conn.execute("DELETE FROM note_terms WHERE note_id = ?", (note_id,))
+            self.conn.execute("DELETE FROM notes WHERE id = ?", (note_id,))
+        return dict(row)
+
+    def clear(self) -> int:
+        """Delete every note and return how many there were. IDs are not reused."""
+        with self.conn:
+            self.conn.execute("DELETE FROM note_terms")
+            self.conn.execute("DELETE FROM terms")
+            return self.conn.execute("DELETE FROM notes").rowcount
@@ -0,0 +1,78 @@
+"""Cryptographically secure random helpers for the learning MCP server.
+
+Randomness comes from ``secrets`` and is drawn in bulk: one ``token_bytes``
+call covers a whole batch of characters, dice rolls or coin flips. Bytes are
+mapped onto ``n`` choices by rejection sampling (bytes at or above the
+largest multiple of ``n`` are thrown away), so every choice is equally
+likely with no modulo bias.
+"""
+
+import secrets
+import string
+from typing import Dict, List, Sequence
+
+CHARACTER_CLASSES: Dict[str, str] = {
+    "lowercase": string.ascii_lowercase,
+    "uppercase": string.ascii_uppercase,
+    "digits": string.digits,
+    "symbols": "!@#$%^&*",
+}
+
+# Characters that are easy to mix up when read or typed by hand
+AMBIGUOUS = set("Il1O0o")
+
+
+def random_below(n: int, count: int) -> List[int]:
+    """Return ``count`` independent, uniform integers in ``range(n)``."""
+    if n <= 0:
+        raise ValueError("n must be positive")
+    if n > 256:
+        return [secrets.randbelow(n) for _ in range(count)]
+
+    limit = 256 - 256 % n
+    values: List[int] = []
+    while len(values) < count:
+        missing = count - len(values)
+        # Ask for enough bytes that one round usually suffices
+        chunk = secrets.token_bytes(missing * 256 // limit + 16)
+        values.extend(b % n for b in chunk if b < limit)
+    del values[count:]
+    return values
+
+
+def build_policy(lowercase: bool = True, uppercase: bool = True, digits: bool = True,
+                 symbols: bool = True, exclude_ambiguous: bool = False) -> List[str]:
+    """Return the enabled character classes, each as a string of characters."""
+    enabled = {"lowercase": lowercase, "uppercase": uppercase, "digits": digits, "symbols": symbols}
+    classes = []
+    for name, chars in CHARACTER_CLASSES.items():
+        if enabled[name]:
+            if exclude_ambiguous:
+                chars = "".join(c for c in chars if c not in AMBIGUOUS)
+            classes.append(chars)
+    return classes
+
+
+def generate_passwords(count: int, length: int, classes: Sequence[str],
+                       require_each_class: bool = True) -> List[str]:
+    """Generate ``count`` passwords drawn uniformly from the union of ``classes``.
+
+    With ``require_each_class``, passwords missing any class are discarded and
+    redrawn, which keeps the result uniform over all passwords that contain
+    every class (unlike patching a character in afterwards).
+    """
+    if require_each_class and length < len(classes):
+        raise ValueError("length is shorter than the number of required character classes")
+    alphabet = "".join(classes)
+    # Maps each random index byte straight to its character in one C-level pass
+    table = alphabet.encode("ascii").ljust(256, b"\0")
+    class_sets = [frozenset(chars) for chars in classes] if require_each_class else []
+    passwords: List[str] = []
+    while len(passwords) < count:
+        needed = count - len(passwords)
+        chars = bytes(random_below(len(alphabet), needed * length)).translate(table).decode("ascii")
+        for start in range(0, len(chars), length):
+            password = chars[start:start + length]
+            if all(not members.isdisjoint(password) for members in class_sets):
+                passwords.append(password)
+    return passwords
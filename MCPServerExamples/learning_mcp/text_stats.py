@@ -0,0 +1,116 @@
+"""Streaming text statistics for the learning MCP server.
+
+``TextStats`` counts characters, words and lines one chunk at a time, so a
+multi-megabyte text or file is processed with memory bounded by the chunk size
+instead of building full lists of words and lines. Results match
+``len(text)``, ``len(text.split())`` and ``len(text.split('\\n'))`` on the
+whole text, including words that straddle a chunk boundary.
+"""
+
+import string
+from collections import Counter
+from itertools import chain
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+CHUNK_SIZE = 1 << 20  # characters per chunk
+
+_PUNCTUATION = string.punctuation + "“”‘’«»…—–"
+
+
+class TextStats:
+    """Accumulate character, word and line counts, and optionally word
+    frequencies (``top_k``) and UTF-8 details (``byte_stats``).
+    """
+
+    def __init__(self, top_k: int = 0, byte_stats: bool = False):
+        self.chars = 0
+        self.words = 0
+        self.newlines = 0
+        self.non_ascii = 0
+        self.utf8_bytes = 0
+        self.replacement_chars = 0
+        self._in_word = False
+        self._carry = ""
+        self._top_k = top_k
+        self._byte_stats = byte_stats
+        self._freq: Optional[Counter] = Counter() if top_k > 0 else None
+
+    @property
+    def lines(self) -> int:
+        """Line count, matching ``len(text.split('\\n'))``."""
+        return self.newlines + 1
+
+    def feed(self, chunk: str) -> None:
+        """Add the next piece of text."""
+        if not chunk:
+            return
+        self.chars += len(chunk)
+        self.newlines += chunk.count("\n")
+        if self._byte_stats:
+            self._count_bytes(chunk)
+
+        words = chunk.split()
+        continues_word = self._in_word and not chunk[0].isspace()
+        self.words += len(words) - (1 if words and continues_word else 0)
+        self._in_word = not chunk[-1].isspace()
+
+        if self._freq is not None:
+            self._count_words(words, continues_word)
+
+    def _count_bytes(self, chunk: str) -> None:
+        if chunk.isascii():
+            self.utf8_bytes += len(chunk)
+        else:
+            self.utf8_bytes += len(chunk.encode("utf-8", "surrogatepass"))
+            self.non_ascii += len(chunk) - len(chunk.encode("ascii", "ignore"))
+            self.replacement_chars += chunk.count("\ufffd")
+
+    def _count_words(self, words: List[str], continues_word: bool) -> None:
+        # A word cut off at the end of a chunk is held back until we know where it ends
+        if self._carry:
+            if words and continues_word:
+                words[0] = self._carry + words[0]
+            else:
+                words = list(chain((self._carry,), words))
+            self._carry = ""
+        if words and self._in_word:
+            self._carry = words.pop()
+        self._freq.update(filter(None, (w.strip(_PUNCTUATION).lower() for w in words)))
+
+    def top_words(self) -> List[Tuple[str, int]]:
+        """The ``top_k`` most common words (case-folded, punctuation stripped)."""
+        if self._freq is None:
+            return []
+        if self._carry:
+            word = self._carry.strip(_PUNCTUATION).lower()
+            if word:
+                self._freq[word] += 1
+            self._carry = ""
+        return self._freq.most_common(self._top_k)
+
+
+def analyze_chunks(chunks: Iterable[str], top_k: int = 0, byte_stats: bool = False) -> TextStats:
+    """Feed every chunk into a fresh ``TextStats`` and return it."""
+    stats = TextStats(top_k, byte_stats)
+    for chunk in chunks:
+        stats.feed(chunk)
+    return stats
+
+
+def iter_text(text: str, chunk_size: int = CHUNK_SIZE) -> Iterable[str]:
+    """Yield ``text`` in slices of at most ``chunk_size`` characters."""
+    for start in range(0, len(text), chunk_size):
+        yield text[start:start + chunk_size]
+
+
+def iter_file(path: Path, chunk_size: int = CHUNK_SIZE) -> Iterable[str]:
+    """Yield a UTF-8 file in decoded chunks without loading it all at once.
+
+    The incremental decoder keeps multi-byte characters that straddle a read
+    boundary intact; undecodable bytes become U+FFFD. ``newline=''`` keeps
+    ``\\r\\n`` as two characters so counts match the bytes on disk.
+    """
+    with open(path, encoding="utf-8", errors="replace", newline="") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
@@ -1,6 +1,24 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+from weather import mcp
+
 def main():
-    print("Hello from weather!")
+    """Main entry point for the weather MCP server."""
+    parser = argparse.ArgumentParser(description="Run the weather MCP server.")
+    parser.add_argument("--transport", choices=["stdio", "streamable-http", "sse"], default="stdio",
+                        help="how clients connect (default: stdio, as MCP hosts expect)")
+    parser.add_argument("--port", type=int, default=8000,
+                        help="port on 127.0.0.1 for the network transports (default: 8000)")
+    args = parser.parse_args()
 
+    print("Starting weather MCP server...", file=sys.stderr)
+    if args.transport != "stdio":
+        mcp.settings.port = args.port
+        path = mcp.settings.streamable_http_path if args.transport == "streamable-http" else mcp.settings.sse_path
+        print(f"Listening on http://{mcp.settings.host}:{args.port}{path}", file=sys.stderr)
+    mcp.run(transport=args.transport)
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,5 @@
 from typing import Any
-import httpx
+import sys
 from mcp.server.fastmcp import FastMCP
 
 # Initialize FastMCP server
@@ -11,6 +11,9 @@ USER_AGENT = "weather-app/1.0"
 
 async def make_nws_request(url: str) -> dict[str, Any] | None:
     """Make a request to the NWS API with proper error handling."""
+    # Imported here so tools that never touch the network don't pay for httpx
+    import httpx
+
     headers = {
         "User-Agent": USER_AGENT,
         "Accept": "application/geo+json"
@@ -92,5 +95,5 @@ Forecast: {period['detailedForecast']}
 
 if __name__ == "__main__":
     # Initialize and run the server
-    print("Starting weather MCP server...")
+    print("Starting weather MCP server...", file=sys.stderr)
     mcp.run(transport='stdio')